@@ -48,6 +48,9 @@ class MigrationConfig:
     batch_size: int = field(
         default_factory=lambda: int(os.getenv("MIGRATION_BATCH_SIZE", "5000"))
     )
+    copy_workers: int = field(
+        default_factory=lambda: int(os.getenv("MIGRATION_COPY_WORKERS", "4"))
+    )
     mapping_file: Path = field(
         default_factory=lambda: Path(os.getenv("MAPPING_FILE", "table_mappings.json"))
     )
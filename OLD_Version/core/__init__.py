@@ -1,6 +1,11 @@
 """core/__init__.py"""
 from core.database import DatabaseManager, DatabaseError, ConnectionLostError, TableSchema
-from core.schema_parser import parse_schema_file, generate_create_table_sql, ParsedSchema
+from core.schema_parser import (
+    parse_schema_file,
+    generate_create_table_sql,
+    defer_unique_keys,
+    ParsedSchema,
+)
 from core.type_converter import classify_conversion, ConversionSafety, get_base_type
 from core.mapping_store import MappingStore
 from core.migrator import MigrationEngine, MigrationResult, MigrationPlan, MigrationError
@@ -12,6 +17,7 @@ __all__ = [
     "TableSchema",
     "parse_schema_file",
     "generate_create_table_sql",
+    "defer_unique_keys",
     "ParsedSchema",
     "classify_conversion",
     "ConversionSafety",
@@ -15,15 +15,25 @@ Design Decisions:
       are inserted into SQL strings. Parameterised execution (``%s``) is used
       for all data values.
     * Logging replaces all print() calls so output is structured and filterable.
+    * Table lists and DESCRIBE results are cached per manager and dropped on
+      ``USE``, on DDL issued through the manager, or on an explicit refresh.
+    * Extra worker sessions (``clone()``) are drawn from a small connection
+      pool, so repeated parallel copies reuse sessions instead of reconnecting
+      each time. The pool holds one session unless ``reserve_sessions()``
+      sizes it up front for parallel work.
 """
 from __future__ import annotations
 
+import re
+import threading
 import time
+from collections import defaultdict
 from contextlib import contextmanager
 from typing import Any, Generator, Iterator
 
 import mysql.connector
-from mysql.connector import MySQLConnection
+from mysql.connector import FieldType, MySQLConnection
+from mysql.connector.pooling import MySQLConnectionPool
 from mysql.connector.cursor import MySQLCursor
 
 from config import CONFIG
@@ -35,6 +45,22 @@ log = get_logger(__name__)
 ColumnSchema = tuple[str, str, str, str, Any, str]  # Field,Type,Null,Key,Default,Extra
 TableSchema = dict[str, ColumnSchema]  # col_name → column tuple
 
+# Statements that change table metadata and so invalidate the schema cache.
+_DDL_RE = re.compile(r"\s*(CREATE|DROP|ALTER|RENAME|TRUNCATE)\b", re.IGNORECASE)
+
+# Result column types the connector always converts to numbers or temporal
+# objects (never bytes). BIT is excluded: older connectors return it raw.
+_NON_BINARY_FIELD_TYPES = frozenset(
+    FieldType.get_number_types()
+    + FieldType.get_timestamp_types()
+    + [FieldType.DATE, FieldType.NEWDATE, FieldType.TIME, FieldType.YEAR]
+) - {FieldType.BIT}
+
+
+def is_non_binary_type(type_code: int) -> bool:
+    """True if values of result column type *type_code* are never ``bytes``."""
+    return type_code in _NON_BINARY_FIELD_TYPES
+
 
 class DatabaseError(Exception):
     """Raised for database-level failures reported by this module."""
@@ -89,8 +115,14 @@ class DatabaseManager:
 
         self._conn: MySQLConnection | None = None
         self._cursor: MySQLCursor | None = None
+        self._pool: MySQLConnectionPool | None = None
+        self._pool_lock = threading.Lock()
         self.current_database: str | None = None
 
+        # Schema metadata cache; see invalidate_schema_cache().
+        self._tables_cache: list[str] | None = None
+        self._describe_cache: dict[str, TableSchema] = {}
+
     # ------------------------------------------------------------------
     # Factory helpers
     # ------------------------------------------------------------------
@@ -107,6 +139,77 @@ class DatabaseManager:
             connect_timeout=CONFIG.db.connect_timeout,
         )
 
+    def clone(self) -> "DatabaseManager":
+        """
+        Return a second, independent session with the same settings.
+
+        The session comes from this manager's worker pool, is switched to
+        :attr:`current_database`, and goes back to the pool when the caller
+        calls :meth:`close` on the clone. If no pool exists yet a
+        single-session one is created; callers that need several clones at
+        once must call :meth:`reserve_sessions` first, because an exhausted
+        pool raises instead of waiting.
+
+        Raises:
+            DatabaseError: If the new connection or ``USE`` fails.
+        """
+        other = DatabaseManager(
+            host=self._host,
+            port=self._port,
+            user=self._user,
+            password=self._password,
+            charset=self._charset,
+            connect_timeout=self._connect_timeout,
+            max_retries=self._max_retries,
+            retry_delay=self._retry_delay,
+        )
+        try:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = self._new_pool(1)
+                pool = self._pool
+            other._conn = pool.get_connection()
+            other._cursor = other._conn.cursor()
+        except mysql.connector.Error as exc:
+            raise DatabaseError(f"Could not open pooled connection: {exc}") from exc
+        if self.current_database:
+            try:
+                other.select_database(self.current_database)
+            except DatabaseError:
+                other.close()
+                raise
+        return other
+
+    def reserve_sessions(self, count: int) -> None:
+        """
+        Make sure the clone pool can hand out *count* sessions at once.
+
+        A smaller existing pool is drained and replaced, so call this before
+        any clone is checked out (e.g. before submitting worker threads).
+
+        Raises:
+            DatabaseError: If the pool cannot be created.
+        """
+        count = max(1, count)
+        with self._pool_lock:
+            if self._pool is not None and self._pool.pool_size >= count:
+                return
+            try:
+                if self._pool is not None:
+                    self._pool._remove_connections()
+                self._pool = None
+                self._pool = self._new_pool(count)
+            except mysql.connector.Error as exc:
+                raise DatabaseError(f"Could not create connection pool: {exc}") from exc
+
+    def _new_pool(self, size: int) -> MySQLConnectionPool:
+        """Open a clone pool of *size* sessions (caller holds ``_pool_lock``)."""
+        return MySQLConnectionPool(
+            pool_name=f"migrator_{id(self):x}_{size}",
+            pool_size=size,
+            **self._connect_args(),
+        )
+
     # ------------------------------------------------------------------
     # Context manager
     # ------------------------------------------------------------------
@@ -139,17 +242,10 @@ class DatabaseManager:
                     "Connecting to MySQL at %s:%s (attempt %d/%d)",
                     self._host, self._port, attempt, self._max_retries,
                 )
-                self._conn = mysql.connector.connect(
-                    host=self._host,
-                    port=self._port,
-                    user=self._user,
-                    password=self._password,
-                    charset=self._charset,
-                    connect_timeout=self._connect_timeout,
-                    get_warnings=True,
-                    raise_on_warnings=False,
-                )
+                self._conn = mysql.connector.connect(**self._connect_args())
                 self._cursor = self._conn.cursor()
+                # A new session may see a different server state.
+                self.invalidate_schema_cache()
                 log.info("Connected to MySQL successfully.")
                 return
             except mysql.connector.Error as exc:
@@ -161,8 +257,20 @@ class DatabaseManager:
             f"after {self._max_retries} attempts."
         )
 
+    def _connect_args(self) -> dict[str, Any]:
+        return {
+            "host": self._host,
+            "port": self._port,
+            "user": self._user,
+            "password": self._password,
+            "charset": self._charset,
+            "connect_timeout": self._connect_timeout,
+            "get_warnings": True,
+            "raise_on_warnings": False,
+        }
+
     def close(self) -> None:
-        """Close cursor and connection, logging any cleanup errors."""
+        """Close cursor, connection and worker pool, logging any cleanup errors."""
         try:
             if self._cursor:
                 self._cursor.close()
@@ -174,8 +282,16 @@ class DatabaseManager:
                 log.info("Database connection closed.")
         except Exception:
             pass
+        with self._pool_lock:
+            if self._pool is not None:
+                try:
+                    self._pool._remove_connections()
+                except Exception:
+                    pass
+                self._pool = None
         self._cursor = None
         self._conn = None
+        self.invalidate_schema_cache()
 
     @property
     def is_connected(self) -> bool:
@@ -216,6 +332,8 @@ class DatabaseManager:
         """
         self._ensure_connected()
         assert self._cursor is not None
+        if _DDL_RE.match(sql):
+            self.invalidate_schema_cache()
         try:
             self._cursor.execute(sql, params)
             return self._cursor
@@ -223,6 +341,26 @@ class DatabaseManager:
             log.error("SQL execution error: %s | SQL: %.500s", exc, sql)
             raise DatabaseError(str(exc)) from exc
 
+    def executemany(self, sql: str, seq_params: list[tuple]) -> MySQLCursor:
+        """
+        Execute *sql* once per parameter tuple in *seq_params*.
+
+        For ``INSERT … VALUES (%s, …)`` the connector rewrites the batch into
+        a single multi-row INSERT, i.e. one round trip.
+
+        Raises:
+            ConnectionLostError: If not connected.
+            DatabaseError: On MySQL execution errors.
+        """
+        self._ensure_connected()
+        assert self._cursor is not None
+        try:
+            self._cursor.executemany(sql, seq_params)
+            return self._cursor
+        except mysql.connector.Error as exc:
+            log.error("SQL execution error: %s | SQL: %.500s", exc, sql)
+            raise DatabaseError(str(exc)) from exc
+
     def fetchall(self) -> list[tuple]:
         """Fetch all rows from the last execute."""
         assert self._cursor is not None
@@ -233,6 +371,43 @@ class DatabaseManager:
         assert self._cursor is not None
         return self._cursor.fetchone()
 
+    def iter_rows(
+        self,
+        sql: str,
+        params: tuple | None = None,
+        batch_size: int = 1_000,
+    ) -> Iterator[tuple]:
+        """
+        Stream the rows of *sql* without buffering the full result.
+
+        Uses a dedicated unbuffered cursor and ``fetchmany`` so memory stays
+        bounded by *batch_size*. The generator must be consumed (or closed)
+        before the connection is used for anything else.
+
+        Raises:
+            ConnectionLostError: If not connected.
+            DatabaseError: On MySQL execution errors.
+        """
+        self._ensure_connected()
+        assert self._conn is not None
+        cursor = self._conn.cursor(buffered=False)
+        try:
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        except mysql.connector.Error as exc:
+            log.error("SQL execution error: %s | SQL: %.500s", exc, sql)
+            raise DatabaseError(str(exc)) from exc
+        finally:
+            # Drain anything left unread (early exit) so the session stays usable.
+            try:
+                self._conn.consume_results()
+            finally:
+                cursor.close()
+
     def commit(self) -> None:
         assert self._conn is not None
         self._conn.commit()
@@ -251,10 +426,18 @@ class DatabaseManager:
         return self._cursor.rowcount
 
     def warnings(self) -> list[tuple]:
-        """Return SQL warnings from the last statement."""
+        """
+        Return SQL warnings from the last statement.
+
+        The connection is opened with ``get_warnings=True``, so the driver
+        has already fetched them (only when the server reported any) and
+        no extra ``SHOW WARNINGS`` round trip is needed. The warning count
+        from the OK packet short-circuits the common no-warning case.
+        """
         try:
-            self._cursor.execute("SHOW WARNINGS")
-            return self.fetchall()
+            if not self._cursor.warning_count:
+                return []
+            return self._cursor.fetchwarnings() or []
         except Exception:
             return []
 
@@ -290,17 +473,38 @@ class DatabaseManager:
         self.execute(f"USE `{name}`")
         self._conn.commit()  # type: ignore[union-attr]
         self.current_database = name
+        self.invalidate_schema_cache()
         log.info("Selected database: %s", name)
 
+    def invalidate_schema_cache(self) -> None:
+        """
+        Forget cached table lists and DESCRIBE results.
+
+        Called automatically on ``USE`` and on DDL run through :meth:`execute`;
+        call it explicitly after changes made on other sessions (e.g. clones)
+        or outside the tool.
+        """
+        self._tables_cache = None
+        self._describe_cache.clear()
+
     def list_tables(self) -> list[str]:
-        """Return table names in the current database."""
-        self._ensure_connected()
-        self.execute("SHOW TABLES")
-        return [row[0] for row in self.fetchall()]
+        """Return table names in the current database (cached)."""
+        if self._tables_cache is None:
+            self._tables_cache = [row[0] for row in self.iter_rows("SHOW TABLES")]
+        return list(self._tables_cache)
+
+    def source_tables(self) -> list[str]:
+        """
+        Return table names excluding ``*_new`` migration targets.
+
+        Filtered from the cached :meth:`list_tables` result, so it costs no
+        extra round trip once the table list is warm.
+        """
+        return [t for t in self.list_tables() if not t.endswith("_new")]
 
     def describe_table(self, table_name: str) -> TableSchema:
         """
-        Fetch the schema of a table using DESCRIBE.
+        Fetch the schema of a table using DESCRIBE (cached).
 
         Args:
             table_name: The (unquoted) table name.
@@ -309,21 +513,82 @@ class DatabaseManager:
             Dict mapping column name → full DESCRIBE row tuple.
             Empty dict if the table cannot be described.
         """
+        cached = self._describe_cache.get(table_name)
+        if cached is not None:
+            return dict(cached)
         try:
             self.execute(f"DESCRIBE `{table_name}`")
             rows = self.fetchall()
-            return {row[0]: row for row in rows}
         except DatabaseError as exc:
             log.warning("Could not describe table '%s': %s", table_name, exc)
             return {}
+        schema = self._describe_cache[table_name] = {row[0]: row for row in rows}
+        return dict(schema)
+
+    def describe_tables(
+        self, table_names: list[str] | None = None
+    ) -> dict[str, TableSchema]:
+        """
+        :meth:`describe_table` for several tables with one round trip.
+
+        Uncached tables are read together from ``information_schema.COLUMNS``,
+        whose columns are selected to mirror a DESCRIBE row. With no
+        *table_names*, every table in the current database is read (and
+        cached) at once. Requested tables that cannot be found map to an
+        empty dict.
+        """
+        if table_names is None:
+            where, params = "", ()
+        else:
+            missing = [t for t in dict.fromkeys(table_names) if t not in self._describe_cache]
+            if not missing:
+                return {t: dict(self._describe_cache[t]) for t in table_names}
+            where = f"AND TABLE_NAME IN ({', '.join(['%s'] * len(missing))}) "
+            params = tuple(missing)
+        fetched: dict[str, TableSchema] = defaultdict(dict)
+        try:
+            # Streamed: with no filter this is every column of every table.
+            for table, *row in self.iter_rows(
+                "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, "
+                "COLUMN_KEY, COLUMN_DEFAULT, EXTRA "
+                "FROM information_schema.COLUMNS "
+                f"WHERE TABLE_SCHEMA = DATABASE() {where}"
+                "ORDER BY TABLE_NAME, ORDINAL_POSITION",
+                params,
+            ):
+                fetched[table][row[0]] = tuple(row)
+            self._describe_cache.update(fetched)
+        except DatabaseError as exc:
+            log.warning("Could not describe tables: %s", exc)
+            fetched = {}
+        if table_names is None:
+            return {t: dict(cols) for t, cols in fetched.items()}
+        return {t: dict(self._describe_cache.get(t, {})) for t in table_names}
 
     def table_exists(self, table_name: str) -> bool:
         """Return True if *table_name* exists in the current database."""
+        return table_name in self.existing_tables([table_name])
+
+    def existing_tables(self, table_names: list[str]) -> set[str]:
+        """
+        Return the subset of *table_names* present in the current database.
+
+        One ``information_schema`` query regardless of how many names are
+        checked; names are matched exactly (``SHOW TABLES LIKE`` would treat
+        ``_`` as a wildcard).
+        """
+        if not table_names:
+            return set()
+        placeholders = ", ".join(["%s"] * len(table_names))
         try:
-            self.execute("SHOW TABLES LIKE %s", (table_name,))
-            return self.fetchone() is not None
+            self.execute(
+                "SELECT TABLE_NAME FROM information_schema.TABLES "
+                f"WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN ({placeholders})",
+                tuple(table_names),
+            )
+            return {row[0] for row in self.fetchall()}
         except DatabaseError:
-            return False
+            return set()
 
     def primary_key_column(self, table_name: str) -> str | None:
         """
@@ -339,7 +604,7 @@ class DatabaseManager:
             return None
 
     def count_rows(self, table_name: str) -> int:
-        """Return the approximate row count for *table_name*."""
+        """Return the exact row count for *table_name* (a full ``COUNT(*)``)."""
         try:
             self.execute(f"SELECT COUNT(*) FROM `{table_name}`")
             row = self.fetchone()
@@ -347,6 +612,26 @@ class DatabaseManager:
         except DatabaseError:
             return 0
 
+    def estimate_rows(self, table_name: str) -> int:
+        """
+        Return the optimizer's row estimate for *table_name* (0 if unknown).
+
+        Reads ``information_schema.TABLES.TABLE_ROWS`` instead of scanning the
+        table, so it is instant on any size; InnoDB estimates can be off by
+        tens of percent.  Use it for progress bars, :meth:`count_rows` when the
+        exact figure matters.
+        """
+        try:
+            self.execute(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                (table_name,),
+            )
+            row = self.fetchone()
+            return int(row[0] or 0) if row else 0
+        except DatabaseError:
+            return 0
+
     @contextmanager
     def transaction(self) -> Generator[None, None, None]:
         """
@@ -10,8 +10,9 @@ Design Decision:
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Callable
 
 from core.database import DatabaseManager
 from core.schema_parser import ParsedSchema
@@ -22,13 +23,29 @@ from models.mapping import (
     SplitMapping,
     MergeMapping,
     MappingType,
+    dump_mappings,
     load_mappings_from_file,
-    save_mappings_to_file,
+    write_mappings_text,
 )
 
 log = get_logger(__name__)
 
 
+def _targets_of(mapping: AnyMapping | None) -> list[str]:
+    """Target schema names written by *mapping*."""
+    if isinstance(mapping, (SingleMapping, MergeMapping)):
+        return [mapping.target_schema_name]
+    if isinstance(mapping, SplitMapping):
+        return list(mapping.target_schema_names)
+    return []
+
+
+def _drop_target(col_map: dict[str, str], new_col: str) -> None:
+    """Delete, in place, every entry of *col_map* that maps onto *new_col*."""
+    for old_col in [k for k, v in col_map.items() if v == new_col]:
+        del col_map[old_col]
+
+
 class MappingStore:
     """
     Thread-unsafe but serialisation-safe mapping registry.
@@ -41,6 +58,15 @@ class MappingStore:
     def __init__(self, file_path: Path | str) -> None:
         self._path = Path(file_path)
         self._data: dict[str, AnyMapping] = {}
+        # Derived lookups: built lazily after load (see _index()), then kept
+        # current by _put() as mappings are added, replaced or removed.
+        self._target_index: dict[str, set[str]] | None = None
+        self._merge_sources: set[str] = set()
+        # Deferred persistence (see defer_saves()); None = save on every change.
+        self._schedule_save: Callable[[Callable[[], None]], None] | None = None
+        self._dirty = False
+        # Optional single-thread writer so file I/O stays off the UI thread.
+        self._writer: ThreadPoolExecutor | None = None
 
     # ------------------------------------------------------------------
     # Persistence
@@ -50,9 +76,14 @@ class MappingStore:
         """
         Load mappings from the JSON file.
 
+        Any deferred save is flushed (and its background write awaited)
+        first so pending edits are not lost.
         Does not raise on missing file (returns empty store).
         Raises ValueError on corrupt JSON.
         """
+        self.flush()
+        self._drain()
+        self._target_index = None
         try:
             self._data = load_mappings_from_file(self._path)
             log.info("Loaded %d mapping(s) from '%s'.", len(self._data), self._path)
@@ -65,13 +96,69 @@ class MappingStore:
         Persist the current mapping state to the JSON file.
 
         Uses an atomic write-then-rename pattern to prevent corruption.
+        The JSON is always built on the calling thread; with a background
+        writer (see :meth:`defer_saves`) only the file write is handed off.
         """
+        self._dirty = False
+        text = dump_mappings(self._data)
+        if self._writer is not None:
+            self._writer.submit(self._write, text, len(self._data))
+        else:
+            self._write(text, len(self._data))
+
+    def _write(self, text: str, count: int) -> None:
         try:
-            save_mappings_to_file(self._path, self._data)
-            log.debug("Saved %d mapping(s) to '%s'.", len(self._data), self._path)
+            write_mappings_text(self._path, text)
+            log.debug("Saved %d mapping(s) to '%s'.", count, self._path)
         except OSError as exc:
             log.error("Failed to save mappings to '%s': %s", self._path, exc)
 
+    def _drain(self) -> None:
+        """Block until every queued background write has landed."""
+        if self._writer is not None:
+            self._writer.submit(lambda: None).result()
+
+    def close(self) -> None:
+        """Flush pending changes and stop the background writer, if any."""
+        self.flush()
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+
+    def defer_saves(
+        self,
+        schedule: Callable[[Callable[[], None]], None],
+        background_io: bool = False,
+    ) -> None:
+        """
+        Coalesce writes: after a mutation, call ``schedule(flush)`` once
+        instead of saving immediately.  Further mutations before the flush
+        runs only mark the store dirty.
+
+        Args:
+            schedule:      Runs the given callback later, e.g.
+                           ``lambda cb: root.after(200, cb)`` in the Tk UI.
+            background_io: Write the file on a single worker thread (writes
+                           stay in order); call :meth:`close` on shutdown.
+        """
+        self._schedule_save = schedule
+        if background_io and self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mapio")
+
+    def flush(self) -> None:
+        """Write pending changes, if any (no-op when the store is clean)."""
+        if self._dirty:
+            self.save()
+
+    def _changed(self) -> None:
+        """Every mutation ends here: persist now or schedule a flush."""
+        if self._schedule_save is None:
+            self.save()
+            return
+        if not self._dirty:
+            self._dirty = True
+            self._schedule_save(self.flush)
+
     # ------------------------------------------------------------------
     # Query helpers
     # ------------------------------------------------------------------
@@ -93,26 +180,56 @@ class MappingStore:
 
     def tables_in_merges(self) -> set[str]:
         """Return all source table names that participate in a merge."""
-        result: set[str] = set()
-        for m in self._data.values():
-            if isinstance(m, MergeMapping):
-                result.update(m.source_tables)
-        return result
+        self._index()
+        return set(self._merge_sources)
 
     def all_mapped_targets(self, exclude_key: str | None = None) -> set[str]:
         """Return all target schema names currently used across all mappings."""
-        targets: set[str] = set()
-        for key, m in self._data.items():
-            if key == exclude_key:
-                continue
-            if isinstance(m, SingleMapping):
-                targets.add(m.target_schema_name)
-            elif isinstance(m, SplitMapping):
-                targets.update(m.target_schema_names)
-            elif isinstance(m, MergeMapping):
-                targets.add(m.target_schema_name)
+        index = self._index()
+        targets = set(index)
+        if exclude_key is not None:
+            for target in _targets_of(self._data.get(exclude_key)):
+                if index.get(target) == {exclude_key}:
+                    targets.discard(target)
         return targets
 
+    def _index(self) -> dict[str, set[str]]:
+        """Reverse index ``target schema → mapping keys`` (one pass, cached)."""
+        if self._target_index is None:
+            index: dict[str, set[str]] = {}
+            merge_sources: set[str] = set()
+            for key, m in self._data.items():
+                for target in _targets_of(m):
+                    index.setdefault(target, set()).add(key)
+                if isinstance(m, MergeMapping):
+                    merge_sources.update(m.source_tables)
+            self._target_index = index
+            self._merge_sources = merge_sources
+        return self._target_index
+
+    def _put(self, key: str, mapping: AnyMapping | None) -> None:
+        """Store (or, with None, delete) *key*, patching the target index."""
+        old = self._data.get(key)
+        if mapping is None:
+            self._data.pop(key, None)
+        else:
+            self._data[key] = mapping  # keeps the key's position in the file
+        index = self._target_index
+        if index is None:
+            return
+        if isinstance(old, MergeMapping) or isinstance(mapping, MergeMapping):
+            # Merge sources may overlap between merges; rebuild on next use.
+            self._target_index = None
+            return
+        for target in _targets_of(old):
+            owners = index.get(target)
+            if owners is not None:
+                owners.discard(key)
+                if not owners:
+                    del index[target]
+        for target in _targets_of(mapping):
+            index.setdefault(target, set()).add(key)
+
     # ------------------------------------------------------------------
     # Mutation helpers
     # ------------------------------------------------------------------
@@ -122,27 +239,27 @@ class MappingStore:
         col_maps = {}
         if isinstance(existing, SingleMapping) and existing.target_schema_name == target_schema:
             col_maps = existing.column_mappings
-        self._data[source_table] = SingleMapping(
+        self._put(source_table, SingleMapping(
             source_table=source_table,
             target_schema_name=target_schema,
             column_mappings=col_maps,
-        )
+        ))
         log.debug("Set single mapping: %s → %s", source_table, target_schema)
-        self.save()
+        self._changed()
 
     def remove(self, key: str) -> bool:
         """Remove a mapping by key. Returns True if a mapping was removed."""
         if key in self._data:
-            del self._data[key]
+            self._put(key, None)
             log.debug("Removed mapping for key '%s'.", key)
-            self.save()
+            self._changed()
             return True
         return False
 
     def set_mapping(self, key: str, mapping: AnyMapping) -> None:
-        self._data[key] = mapping
+        self._put(key, mapping)
         log.debug("Updated mapping for key '%s'.", key)
-        self.save()
+        self._changed()
 
     def set_column_mapping(
         self,
@@ -162,18 +279,16 @@ class MappingStore:
                            to update. Required if the mapping is a split.
         """
         m = self._data.get(source_table)
-        if isinstance(m, SingleMapping):
-            m.column_mappings[old_col] = new_col
-        elif isinstance(m, SplitMapping):
-            if split_target is None:
-                raise ValueError("split_target required for SplitMapping column mapping.")
-            for t in m.targets:
-                if t.schema_name == split_target:
-                    t.column_mappings[old_col] = new_col
-                    break
-        else:
+        if not isinstance(m, (SingleMapping, SplitMapping)):
             raise ValueError(f"No single/split mapping found for '{source_table}'.")
-        self.save()
+        if isinstance(m, SplitMapping) and split_target is None:
+            raise ValueError("split_target required for SplitMapping column mapping.")
+        col_map = self._column_map(source_table, split_target)
+        if col_map is not None:
+            # A target column has at most one source: evict any previous owner.
+            _drop_target(col_map, new_col)
+            col_map[old_col] = new_col
+        self._changed()
 
     def remove_column_mapping(
         self,
@@ -182,18 +297,23 @@ class MappingStore:
         split_target: str | None = None,
     ) -> None:
         """Remove an explicit column mapping by target column name."""
+        col_map = self._column_map(source_table, split_target)
+        if col_map is not None:
+            _drop_target(col_map, new_col)
+        self._changed()
+
+    def _column_map(
+        self, source_table: str, split_target: str | None
+    ) -> dict[str, str] | None:
+        """The live column-mapping dict for a single mapping or split target."""
         m = self._data.get(source_table)
         if isinstance(m, SingleMapping):
-            m.column_mappings = {
-                k: v for k, v in m.column_mappings.items() if v != new_col
-            }
-        elif isinstance(m, SplitMapping):
+            return m.column_mappings
+        if isinstance(m, SplitMapping):
             for t in m.targets:
                 if t.schema_name == split_target:
-                    t.column_mappings = {
-                        k: v for k, v in t.column_mappings.items() if v != new_col
-                    }
-        self.save()
+                    return t.column_mappings
+        return None
 
     # ------------------------------------------------------------------
     # Auto-mapping
@@ -214,28 +334,27 @@ class MappingStore:
         Returns:
             Number of new mappings created.
         """
-        tables_db = set(db.list_tables())
+        tables_db = set(db.source_tables())
         tables_schema = set(schema.keys())
+        merged = self.tables_in_merges()
         new_count = 0
 
         for table in sorted(tables_db & tables_schema):
             if table in self._data:
                 continue  # Do not override existing mapping
-            if table.endswith("_new"):
-                continue
-            if table in self.tables_in_merges():
+            if table in merged:
                 continue
 
             # Auto-map: same name → single mapping with no column overrides
-            self._data[table] = SingleMapping(
+            self._put(table, SingleMapping(
                 source_table=table,
                 target_schema_name=table,
                 column_mappings={},
-            )
+            ))
             new_count += 1
             log.debug("Auto-mapped table '%s'.", table)
 
         if new_count:
-            self.save()
+            self._changed()
             log.info("Auto-mapped %d table(s).", new_count)
         return new_count
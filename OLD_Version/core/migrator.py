@@ -8,21 +8,34 @@ Design Decisions:
       (DatabaseManager, config, schema dict, mappings).  No global state.
     * Progress is reported via a callback (``progress_cb``) so both CLI
       and GUI callers can display updates without coupling this module to Tkinter.
-    * Batched LIMIT/OFFSET pattern is used for safety on large tables.
-      Cursors are not used for server-side streaming to keep the MySQL
-      connection state simple.
+    * Plain single-table copies run as one server-side INSERT … SELECT with
+      a single commit. Every copy runs with unique/foreign-key checks
+      relaxed for the session (see ``BULK_LOAD_FAST_UNSAFE`` for more).
+    * Merge (JOIN) copies stream the joined rows through the client on a
+      second session and write them back as multi-row INSERTs, so the join
+      is evaluated once. Without a second session they fall back to batched
+      INSERT … SELECT paged by primary-key range.
+    * Split targets are disjoint tables and are copied concurrently, each
+      on its own cloned connection (``MIGRATION_COPY_WORKERS``).
+    * Inline UNIQUE keys are stripped from the CREATE and added by one
+      ALTER TABLE after the copy, so InnoDB builds them sorted, once.
     * All DDL/DML is executed inside explicit transaction boundaries.
     * Lossy conversion warnings are surfaced as structured data; the caller
       decides whether to ask the user for confirmation.
 """
 from __future__ import annotations
 
+import os
+import re
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing, contextmanager
 from dataclasses import dataclass, field
-from typing import Callable
+from typing import Callable, Iterator
 
 from core.database import DatabaseManager, DatabaseError, TableSchema
-from core.schema_parser import ParsedSchema, generate_create_table_sql
+from core.schema_parser import ParsedSchema, defer_unique_keys, generate_create_table_sql
 from core.type_converter import (
     classify_conversion,
     ConversionSafety,
@@ -43,6 +56,38 @@ log = get_logger(__name__)
 
 ProgressCallback = Callable[[str, int, int], None]  # message, current, total
 
+# A FROM clause naming exactly one backtick-quoted table (no JOIN / WHERE).
+_PLAIN_TABLE_RE = re.compile(r"^`\w+`$")
+
+# The WHERE keyword of join_conditions that filter as well as join.
+_WHERE_RE = re.compile(r"\bWHERE\b", re.IGNORECASE)
+
+# Merge sources; these are streamed through the client (see _copy_via_client).
+_JOIN_RE = re.compile(r"\bJOIN\b", re.IGNORECASE)
+
+# Values per multi-row INSERT. executemany() expands the statement on the
+# client, so the real limit is max_allowed_packet; capping the value count
+# keeps wide rows' statements well inside it.
+MAX_PLACEHOLDERS = 65_535
+
+# Session variables switched off for the duration of every copy.
+_BULK_SESSION_VARS = ("unique_checks", "foreign_key_checks")
+
+# Durability/replication trade-off, off by default. When True the copy also
+# runs with sql_log_bin=0: it is not written to the binary log, so replicas
+# and point-in-time recovery never see the new table's rows. Needs the
+# SYSTEM_VARIABLES_ADMIN (or SUPER) privilege; refused settings are skipped.
+# innodb_flush_log_at_trx_commit / sync_binlog are GLOBAL-only in MySQL and
+# are deliberately not touched by the tool.
+BULK_LOAD_FAST_UNSAFE = False
+
+# Opt-in: copy plain single-table sources through a server-side dump file
+# (SELECT … INTO OUTFILE + LOAD DATA INFILE). Requires the FILE privilege and
+# a non-NULL secure_file_priv; falls back to INSERT … SELECT otherwise. The
+# server cannot delete files, so the dump is removed only when the client
+# can reach it (same host); otherwise its path is logged for the operator.
+SUPPORTS_OUTFILE = False
+
 
 # ---------------------------------------------------------------------------
 # Result types
@@ -151,7 +196,10 @@ class MigrationEngine:
     # ------------------------------------------------------------------
 
     def analyse_single(
-        self, mapping: SingleMapping, target_schema_name: str | None = None
+        self,
+        mapping: SingleMapping,
+        target_schema_name: str | None = None,
+        db_schema: TableSchema | None = None,
     ) -> MigrationPlan:
         """
         Analyse a single-table migration and return a plan (no DB changes).
@@ -160,6 +208,9 @@ class MigrationEngine:
             mapping:            The :class:`SingleMapping` to analyse.
             target_schema_name: Override target name (used internally for
                                 split targets); defaults to mapping value.
+            db_schema:          Already-described source schema. Callers
+                                analysing several targets of the same source
+                                pass it to avoid one DESCRIBE per target.
 
         Returns:
             :class:`MigrationPlan` with classified column pairs.
@@ -168,7 +219,8 @@ class MigrationEngine:
             MigrationError: If source or target schema is unavailable.
         """
         target_name = target_schema_name or mapping.target_schema_name
-        db_schema = self._db.describe_table(mapping.source_table)
+        if db_schema is None:
+            db_schema = self._db.describe_table(mapping.source_table)
         if not db_schema:
             raise MigrationError(
                 f"Cannot read schema for source table '{mapping.source_table}'."
@@ -230,22 +282,22 @@ class MigrationEngine:
         Returns:
             List of :class:`MigrationResult` (one per target table).
         """
-        results: list[MigrationResult] = []
         db_schema = self._db.describe_table(mapping.source_table)
         if not db_schema:
             raise MigrationError(
                 f"Cannot read schema for source table '{mapping.source_table}'."
             )
 
-        for target in mapping.targets:
+        # Results by target position; jobs fill their slots as they finish.
+        results: dict[int, MigrationResult] = {}
+        jobs: list[tuple[int, str, MigrationPlan]] = []
+        for slot, target in enumerate(mapping.targets):
             if not target.schema_name or target.schema_name not in self._schema:
                 log.error("Split target '%s' not in schema — skipping.", target.schema_name)
-                results.append(
-                    MigrationResult(
-                        table_name=f"{target.schema_name}_new",
-                        success=False,
-                        errors=[f"Schema definition missing for '{target.schema_name}'"],
-                    )
+                results[slot] = MigrationResult(
+                    table_name=f"{target.schema_name}_new",
+                    success=False,
+                    errors=[f"Schema definition missing for '{target.schema_name}'"],
                 )
                 continue
 
@@ -261,15 +313,59 @@ class MigrationEngine:
                 lossy_columns=[p for p in pairs if p.is_lossy],
                 unsafe_columns=[p for p in pairs if p.is_unsafe],
             )
-            result = self._execute_plan(
-                source_table=mapping.source_table,
-                target_schema_name=target.schema_name,
-                plan=plan,
-                confirm_lossy=confirm_lossy,
-            )
-            results.append(result)
+            jobs.append((slot, target.schema_name, plan))
+
+        # Refuse before any target is created, not from inside a worker.
+        for _, _, plan in jobs:
+            self._check_plan_safety(plan, confirm_lossy)
+
+        # One round trip for every target's existence check.
+        existing = self._db.existing_tables([f"{name}_new" for _, name, _ in jobs])
+        for _, schema_name, _ in jobs:
+            if f"{schema_name}_new" in existing:
+                raise MigrationError(
+                    f"Target table '{schema_name}_new' already exists. Drop it first."
+                )
+
+        workers = min(len(jobs), CONFIG.migration.copy_workers)
+        if workers > 1:
+            # Size the clone pool here, before any worker asks for a session.
+            try:
+                self._db.reserve_sessions(workers)
+            except DatabaseError as exc:
+                log.warning("No worker pool (%s); copying split targets serially.", exc)
+                workers = 1
+        if workers <= 1:
+            for slot, schema_name, plan in jobs:
+                results[slot] = self._execute_plan(
+                    source_table=mapping.source_table,
+                    target_schema_name=schema_name,
+                    plan=plan,
+                    confirm_lossy=confirm_lossy,
+                    check_target=False,
+                )
+            return [results[slot] for slot in sorted(results)]
+
+        # Targets are disjoint tables, so each copies on its own connection.
+        # Progress is reported from this thread only (callbacks may touch Tk).
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(
+                    self._execute_plan_isolated,
+                    mapping.source_table, schema_name, plan, confirm_lossy,
+                ): slot
+                for slot, schema_name, plan in jobs
+            }
+            try:
+                for done, future in enumerate(as_completed(futures), start=1):
+                    result = future.result()
+                    results[futures[future]] = result
+                    self._progress(f"Split target {result.table_name} done", done, len(jobs))
+            finally:
+                # Tables were created on other sessions.
+                self._db.invalidate_schema_cache()
 
-        return results
+        return [results[slot] for slot in sorted(results)]
 
     def migrate_merge(
         self,
@@ -306,12 +402,14 @@ class MigrationEngine:
         lossy_warnings: list[str] = []
         fatal: str | None = None
 
+        # target column → first source specifier mapped onto it
+        reverse: dict[str, str] = {}
+        for src, tgt in mapping.column_mappings.items():
+            reverse.setdefault(tgt, src)
+
         for new_col, new_def in new_schema.items():
             # Resolve source specifier from column_mappings
-            source_spec = next(
-                (src for src, tgt in mapping.column_mappings.items() if tgt == new_col),
-                None,
-            )
+            source_spec = reverse.get(new_col)
             if not source_spec or "." not in source_spec:
                 log.warning(
                     "No 'table.column' mapping for target column '%s' in merge '%s'. Skipping.",
@@ -359,7 +457,8 @@ class MigrationEngine:
                 f"Target table '{target_db_name}' already exists. Drop it first."
             )
 
-        create_sql = generate_create_table_sql(target_db_name, new_schema)
+        table_defs, index_sql = defer_unique_keys(target_db_name, new_schema)
+        create_sql = generate_create_table_sql(target_db_name, table_defs)
         from_clause = f"`{mapping.source_tables[0]}`"
         if mapping.join_conditions:
             from_clause += f" {mapping.join_conditions}"
@@ -372,6 +471,7 @@ class MigrationEngine:
             from_clause=from_clause,
             source_ref=mapping.merge_key,
             warnings=lossy_warnings,
+            index_sql=index_sql,
         )
 
     # ------------------------------------------------------------------
@@ -425,14 +525,51 @@ class MigrationEngine:
             )
         return pairs
 
-    def _execute_plan(
+    def _execute_plan_isolated(
         self,
         source_table: str,
         target_schema_name: str,
         plan: MigrationPlan,
         confirm_lossy: bool,
     ) -> MigrationResult:
-        """Validate a plan's safety then create → copy."""
+        """
+        Run :meth:`_execute_plan` on a cloned connection (worker threads).
+
+        The target's absence was already checked by :meth:`migrate_split`.
+        """
+        try:
+            db = self._db.clone()
+        except DatabaseError as exc:
+            return MigrationResult(
+                table_name=f"{target_schema_name}_new",
+                success=False,
+                errors=[f"Could not open worker connection: {exc}"],
+            )
+        try:
+            worker = MigrationEngine(
+                db=db,
+                schema=self._schema,
+                mappings=self._mappings,
+                batch_size=self._batch_size,
+            )
+            return worker._execute_plan(
+                source_table=source_table,
+                target_schema_name=target_schema_name,
+                plan=plan,
+                confirm_lossy=confirm_lossy,
+                check_target=False,
+            )
+        finally:
+            db.close()
+
+    @staticmethod
+    def _check_plan_safety(plan: MigrationPlan, confirm_lossy: bool) -> None:
+        """
+        Raise if *plan* has unsafe conversions, or lossy ones not confirmed.
+
+        Raises:
+            MigrationError: Describing the offending columns.
+        """
         if plan.unsafe_columns:
             details = "; ".join(
                 f"`{p.target_column}` ({p.source_type} → {p.target_type})"
@@ -449,15 +586,32 @@ class MigrationEngine:
                 f"Lossy conversions detected (confirm_lossy=False): {details}"
             )
 
+    def _execute_plan(
+        self,
+        source_table: str,
+        target_schema_name: str,
+        plan: MigrationPlan,
+        confirm_lossy: bool,
+        check_target: bool = True,
+    ) -> MigrationResult:
+        """
+        Validate a plan's safety then create → copy.
+
+        *check_target* is False when the caller has already verified, in
+        bulk, that the target table does not exist.
+        """
+        self._check_plan_safety(plan, confirm_lossy)
+
         target_db_name = f"{target_schema_name}_new"
-        if self._db.table_exists(target_db_name):
+        if check_target and self._db.table_exists(target_db_name):
             raise MigrationError(
                 f"Target table '{target_db_name}' already exists. Drop it first."
             )
 
-        create_sql = generate_create_table_sql(
+        table_defs, index_sql = defer_unique_keys(
             target_db_name, self._schema[target_schema_name]
         )
+        create_sql = generate_create_table_sql(target_db_name, table_defs)
         insert_cols = [f"`{p.target_column}`" for p in plan.column_pairs]
         select_clause = ", ".join(p.select_expression for p in plan.column_pairs)
         from_clause = f"`{source_table}`"
@@ -474,6 +628,7 @@ class MigrationEngine:
             from_clause=from_clause,
             source_ref=source_table,
             warnings=lossy_warnings,
+            index_sql=index_sql,
         )
 
     def _create_and_copy(
@@ -485,8 +640,14 @@ class MigrationEngine:
         from_clause: str,
         source_ref: str,
         warnings: list[str],
+        index_sql: str | None = None,
     ) -> MigrationResult:
-        """Execute CREATE TABLE then copy data in batches."""
+        """
+        Execute CREATE TABLE, copy the data, then add deferred indexes.
+
+        *index_sql* (from :func:`defer_unique_keys`) runs only after a clean
+        copy, so the unique indexes are built once instead of per row.
+        """
         start = time.monotonic()
         result = MigrationResult(
             table_name=target_db_name,
@@ -506,14 +667,30 @@ class MigrationEngine:
             return result
 
         # --- COPY DATA ---
-        rows_copied = self._copy_batched(
-            source_ref=source_ref,
-            target_db_name=target_db_name,
-            insert_cols=insert_cols,
-            select_clause=select_clause,
-            from_clause=from_clause,
-            result=result,
-        )
+        if _PLAIN_TABLE_RE.match(from_clause):
+            copy = self._copy_whole
+        elif _JOIN_RE.search(from_clause):
+            copy = self._copy_via_client
+        else:
+            copy = self._copy_batched
+        with self._bulk_session():
+            rows_copied = copy(
+                source_ref=source_ref,
+                target_db_name=target_db_name,
+                insert_cols=insert_cols,
+                select_clause=select_clause,
+                from_clause=from_clause,
+                result=result,
+            )
+
+        # --- DEFERRED INDEXES ---
+        if index_sql and not result.errors:
+            self._progress(f"Building indexes on {target_db_name}", rows_copied, rows_copied)
+            try:
+                self._db.execute(index_sql)
+            except DatabaseError as exc:
+                result.errors.append(f"Adding unique keys failed: {exc}")
+                log.error("Failed to index '%s': %s\nSQL:\n%s", target_db_name, exc, index_sql)
 
         result.rows_copied = rows_copied
         result.elapsed_seconds = time.monotonic() - start
@@ -524,6 +701,164 @@ class MigrationEngine:
         )
         return result
 
+    def _copy_whole(
+        self,
+        source_ref: str,
+        target_db_name: str,
+        insert_cols: list[str],
+        select_clause: str,
+        from_clause: str,
+        result: MigrationResult,
+    ) -> int:
+        """
+        Copy a plain single-table source with one INSERT … SELECT.
+
+        Avoids the OFFSET re-scan of the batched path (each batch re-reads
+        every preceding row) and commits once instead of once per batch.
+        """
+        if not insert_cols or not select_clause:
+            log.warning("Empty copy parameters for '%s'. Skipping data copy.", target_db_name)
+            return 0
+
+        total_rows = self._db.estimate_rows(source_ref)
+        self._progress(f"Copying data → {target_db_name}", 0, total_rows)
+
+        if SUPPORTS_OUTFILE:
+            rows_copied = self._copy_via_outfile(
+                target_db_name, insert_cols, select_clause, from_clause, result
+            )
+            if rows_copied is not None:
+                self._progress(
+                    f"Copying → {target_db_name}: {rows_copied} rows", rows_copied, total_rows
+                )
+                return rows_copied
+
+        query = (
+            f"INSERT INTO `{target_db_name}` ({', '.join(insert_cols)}) "
+            f"SELECT {select_clause} FROM {from_clause};"
+        )
+        try:
+            self._db.execute(query)
+            rows_copied = self._db.rowcount
+            for w in self._db.warnings():
+                result.warnings.append(str(w[2]))
+            self._db.commit()
+        except DatabaseError as exc:
+            self._db.rollback()
+            error_msg = f"Copy into '{target_db_name}' failed: {exc}"
+            result.errors.append(error_msg)
+            log.error(error_msg)
+            log.debug("Failed query:\n%s", query)
+            return 0
+
+        self._progress(
+            f"Copying → {target_db_name}: {rows_copied} rows", rows_copied, total_rows
+        )
+        return rows_copied
+
+    def _outfile_dir(self) -> str | None:
+        """Server directory usable for INTO OUTFILE, or None if disabled."""
+        try:
+            self._db.execute("SELECT @@GLOBAL.secure_file_priv, @@GLOBAL.tmpdir")
+            row = self._db.fetchone()
+        except DatabaseError:
+            return None
+        if not row or row[0] is None:
+            return None  # secure_file_priv = NULL: file export disabled
+        return (row[0] or row[1] or "").rstrip("/\\") or None
+
+    def _copy_via_outfile(
+        self,
+        target_db_name: str,
+        insert_cols: list[str],
+        select_clause: str,
+        from_clause: str,
+        result: MigrationResult,
+    ) -> int | None:
+        """
+        Copy through a server-side dump file; return rows loaded.
+
+        Returns None (nothing written to the target) when the server does
+        not allow file export or the dump step fails, so the caller can use
+        INSERT … SELECT instead. Both statements use MySQL's default
+        tab/newline/backslash format, so NULLs and escapes round-trip.
+        """
+        directory = self._outfile_dir()
+        if directory is None:
+            log.info("secure_file_priv disables file export; using INSERT … SELECT.")
+            return None
+        path = f"{directory}/{target_db_name}_{uuid.uuid4().hex}.tsv"
+
+        try:
+            self._db.execute(
+                f"SELECT {select_clause} INTO OUTFILE %s CHARACTER SET utf8mb4 "
+                f"FROM {from_clause}",
+                (path,),
+            )
+        except DatabaseError as exc:
+            log.warning("INTO OUTFILE failed (%s); using INSERT … SELECT.", exc)
+            return None
+
+        try:
+            self._db.execute(
+                f"LOAD DATA INFILE %s INTO TABLE `{target_db_name}` "
+                f"CHARACTER SET utf8mb4 ({', '.join(insert_cols)})",
+                (path,),
+            )
+            rows_copied = self._db.rowcount
+            for w in self._db.warnings():
+                result.warnings.append(str(w[2]))
+            self._db.commit()
+            return rows_copied
+        except DatabaseError as exc:
+            self._db.rollback()
+            error_msg = f"LOAD DATA into '{target_db_name}' failed: {exc}"
+            result.errors.append(error_msg)
+            log.error(error_msg)
+            return 0
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                log.info("Dump file left on the database server: %s", path)
+
+    @contextmanager
+    def _bulk_session(self) -> Iterator[None]:
+        """
+        Relax per-row unique and foreign-key checks for the current session.
+
+        The target table is freshly created and filled from its sources, so
+        these checks only cost time. With :data:`BULK_LOAD_FAST_UNSAFE` the
+        copy is also kept out of the binary log. Only settings that were
+        actually changed are restored on exit; a setting the server refuses
+        (e.g. missing privilege) is logged and skipped.
+        """
+        names = list(_BULK_SESSION_VARS)
+        if BULK_LOAD_FAST_UNSAFE:
+            names.append("sql_log_bin")
+        try:
+            self._db.execute("SELECT " + ", ".join(f"@@SESSION.{n}" for n in names))
+            saved = self._db.fetchone() or (1,) * len(names)
+        except DatabaseError as exc:
+            log.warning("Could not read session settings; copying without them: %s", exc)
+            saved, names = (), []
+
+        changed: list[tuple[str, object]] = []
+        for name, value in zip(names, saved):
+            try:
+                self._db.execute(f"SET SESSION {name} = 0")
+                changed.append((name, value))
+            except DatabaseError as exc:
+                log.warning("Could not set %s for bulk copy: %s", name, exc)
+        try:
+            yield
+        finally:
+            for name, value in changed:
+                try:
+                    self._db.execute(f"SET SESSION {name} = %s", (value,))
+                except DatabaseError as exc:
+                    log.warning("Could not restore session %s: %s", name, exc)
+
     def _copy_batched(
         self,
         source_ref: str,
@@ -534,24 +869,205 @@ class MigrationEngine:
         result: MigrationResult,
     ) -> int:
         """
-        Perform batched INSERT … SELECT with LIMIT/OFFSET and return total rows copied.
+        Perform batched INSERT … SELECT and return total rows copied.
+
+        Batches are paged by key range on the primary source table's PK
+        (keyset pagination), so each batch is an index range seek rather
+        than an OFFSET scan over all preceding rows. Falls back to
+        LIMIT/OFFSET when the primary source has no primary key.
         """
         if not insert_cols or not select_clause or not from_clause:
             log.warning("Empty copy parameters for '%s'. Skipping data copy.", target_db_name)
             return 0
 
         # Estimate total rows (best-effort; may not be exact for JOINs)
-        primary_source = source_ref if not source_ref.startswith("MERGE:") else None
-        if primary_source:
-            total_rows = self._db.count_rows(primary_source)
-        else:
-            total_rows = 0
+        primary_source = self._primary_source(from_clause)
+        total_rows = self._db.estimate_rows(primary_source) if primary_source else 0
 
         self._progress(f"Copying data → {target_db_name}", 0, total_rows)
 
-        # Try to find an ORDER BY column for deterministic paging
-        order_col = self._determine_order_column(source_ref, from_clause)
+        order_col = self._determine_order_column(from_clause)
+        if order_col is None:
+            return self._copy_batched_offset(
+                target_db_name, insert_cols, select_clause, from_clause, total_rows, result
+            )
 
+        insert_cols_str = ", ".join(insert_cols)
+        # join_conditions may already carry a WHERE clause of their own;
+        # parenthesise it so a top-level OR cannot escape the key range.
+        glue = "WHERE"
+        user_where = _WHERE_RE.search(from_clause)
+        if user_where:
+            condition = from_clause[user_where.end():].strip()
+            from_clause = f"{from_clause[:user_where.start()]} WHERE ({condition})"
+            glue = "AND"
+        last_key = None
+        rows_copied = 0
+        batch_num = 0
+
+        while True:
+            if not self._db.is_connected:
+                result.errors.append("Connection lost during data copy.")
+                break
+
+            lower = f"{order_col} > %s" if last_key is not None else "1 = 1"
+            lower_params: tuple = (last_key,) if last_key is not None else ()
+            query = ""
+            try:
+                # Upper key of this batch; None means the remainder fits in one batch.
+                self._db.execute(
+                    f"SELECT {order_col} FROM {from_clause} {glue} {lower} "
+                    f"ORDER BY {order_col} LIMIT 1 OFFSET {self._batch_size - 1}",
+                    lower_params,
+                )
+                row = self._db.fetchone()
+                upper_key = row[0] if row else None
+
+                where = lower
+                params = lower_params
+                if upper_key is not None:
+                    where += f" AND {order_col} <= %s"
+                    params += (upper_key,)
+                query = (
+                    f"INSERT INTO `{target_db_name}` ({insert_cols_str}) "
+                    f"SELECT {select_clause} FROM {from_clause} {glue} {where};"
+                )
+                self._db.execute(query, params)
+                batch_count = self._db.rowcount
+                # Surface any MySQL warnings (collected by the driver)
+                for w in self._db.warnings():
+                    result.warnings.append(f"[Batch {batch_num}] {w[2]}")
+                self._db.commit()
+
+                rows_copied += batch_count
+                batch_num += 1
+                self._progress(
+                    f"Copying → {target_db_name}: {rows_copied} rows",
+                    rows_copied,
+                    total_rows,
+                )
+                log.debug(
+                    "Batch %d done: %d rows (keys after %r up to %r).",
+                    batch_num, batch_count, last_key, upper_key,
+                )
+
+                if upper_key is None:
+                    break  # Last batch
+                last_key = upper_key
+
+            except DatabaseError as exc:
+                self._db.rollback()
+                error_msg = (
+                    f"Batch copy failed after key {last_key!r} for '{target_db_name}': {exc}"
+                )
+                result.errors.append(error_msg)
+                log.error(error_msg)
+                log.debug("Failed query:\n%s", query)
+                break
+
+        return rows_copied
+
+    def _copy_via_client(
+        self,
+        source_ref: str,
+        target_db_name: str,
+        insert_cols: list[str],
+        select_clause: str,
+        from_clause: str,
+        result: MigrationResult,
+    ) -> int:
+        """
+        Copy a JOIN source by streaming it through the client.
+
+        The SELECT runs once on a second (pooled) session with an unbuffered
+        cursor, so the join is evaluated a single time and source rows are
+        not locked as they would be by INSERT … SELECT. Rows are written back
+        as multi-row INSERTs, committed per chunk; a chunk is ``batch_size``
+        rows, shrunk for wide tables to stay under :data:`MAX_PLACEHOLDERS`.
+        Falls back to :meth:`_copy_batched` if no second session is available.
+        """
+        if not insert_cols or not select_clause or not from_clause:
+            log.warning("Empty copy parameters for '%s'. Skipping data copy.", target_db_name)
+            return 0
+        try:
+            reader = self._db.clone()
+        except DatabaseError as exc:
+            log.warning("No reader session for '%s' (%s); using INSERT … SELECT.", target_db_name, exc)
+            return self._copy_batched(
+                source_ref, target_db_name, insert_cols, select_clause, from_clause, result
+            )
+
+        primary_source = self._primary_source(from_clause)
+        total_rows = self._db.estimate_rows(primary_source) if primary_source else 0
+        self._progress(f"Copying data → {target_db_name}", 0, total_rows)
+
+        query = (
+            f"INSERT INTO `{target_db_name}` ({', '.join(insert_cols)}) "
+            f"VALUES ({', '.join(['%s'] * len(insert_cols))})"
+        )
+        batch_size = max(1, min(self._batch_size, MAX_PLACEHOLDERS // len(insert_cols)))
+        rows_copied = 0
+        batch_num = 0
+        batch: list[tuple] = []
+        try:
+            # closing() drains the stream before reader.close() returns the
+            # session to the pool, even when a write fails mid-stream.
+            with closing(reader.iter_rows(
+                f"SELECT {select_clause} FROM {from_clause}", batch_size=batch_size
+            )) as rows:
+                for row in rows:
+                    batch.append(row)
+                    if len(batch) < batch_size:
+                        continue
+                    rows_copied += self._write_batch(query, batch, batch_num, result)
+                    batch_num += 1
+                    batch = []
+                    self._progress(
+                        f"Copying → {target_db_name}: {rows_copied} rows", rows_copied, total_rows
+                    )
+            if batch:
+                rows_copied += self._write_batch(query, batch, batch_num, result)
+                self._progress(
+                    f"Copying → {target_db_name}: {rows_copied} rows", rows_copied, total_rows
+                )
+        except DatabaseError as exc:
+            self._db.rollback()
+            error_msg = (
+                f"Client-side copy failed after {rows_copied} rows for '{target_db_name}': {exc}"
+            )
+            result.errors.append(error_msg)
+            log.error(error_msg)
+        finally:
+            reader.close()
+
+        return rows_copied
+
+    def _write_batch(
+        self,
+        query: str,
+        batch: list[tuple],
+        batch_num: int,
+        result: MigrationResult,
+    ) -> int:
+        """Insert *batch* with one multi-row INSERT and commit; return rows written."""
+        self._db.executemany(query, batch)
+        count = self._db.rowcount
+        for w in self._db.warnings():
+            result.warnings.append(f"[Batch {batch_num}] {w[2]}")
+        self._db.commit()
+        log.debug("Batch %d done: %d rows.", batch_num + 1, count)
+        return count
+
+    def _copy_batched_offset(
+        self,
+        target_db_name: str,
+        insert_cols: list[str],
+        select_clause: str,
+        from_clause: str,
+        total_rows: int,
+        result: MigrationResult,
+    ) -> int:
+        """LIMIT/OFFSET batching for sources without a usable primary key."""
         insert_cols_str = ", ".join(insert_cols)
         offset = 0
         rows_copied = 0
@@ -562,7 +1078,7 @@ class MigrationEngine:
                 result.errors.append("Connection lost during data copy.")
                 break
 
-            limited = f"{from_clause} ORDER BY {order_col} LIMIT {self._batch_size} OFFSET {offset}"
+            limited = f"{from_clause} ORDER BY 1 LIMIT {self._batch_size} OFFSET {offset}"
             query = (
                 f"INSERT INTO `{target_db_name}` ({insert_cols_str}) "
                 f"SELECT {select_clause} FROM {limited};"
@@ -571,11 +1087,9 @@ class MigrationEngine:
             try:
                 self._db.execute(query)
                 batch_count = self._db.rowcount
-                self._db.commit()
-
-                # Surface any MySQL warnings
                 for w in self._db.warnings():
                     result.warnings.append(f"[Batch {batch_num}] {w[2]}")
+                self._db.commit()
 
                 rows_copied += batch_count
                 batch_num += 1
@@ -605,20 +1119,21 @@ class MigrationEngine:
 
         return rows_copied
 
-    def _determine_order_column(self, source_ref: str, from_clause: str) -> str:
+    @staticmethod
+    def _primary_source(from_clause: str) -> str | None:
+        """Return the first (FROM) table named in *from_clause*, if any."""
+        match = re.match(r"`(\w+)`", from_clause)
+        return match.group(1) if match else None
+
+    def _determine_order_column(self, from_clause: str) -> str | None:
         """
-        Best-effort ORDER BY expression for deterministic LIMIT/OFFSET.
+        Key expression used to page the batched copy deterministically.
 
-        Prefers the primary key of the primary source table; falls back to 1.
+        Uses the primary key of the primary (FROM) source table; returns
+        None when it has none.
         """
-        if source_ref.startswith("MERGE:"):
-            # Try to extract the first table name from the FROM clause
-            match = __import__("re").match(r"`(\w+)`", from_clause)
-            if match:
-                pk = self._db.primary_key_column(match.group(1))
-                if pk:
-                    return f"`{match.group(1)}`.`{pk}`"
-            return "1"
-
-        pk = self._db.primary_key_column(source_ref)
-        return f"`{source_ref}`.`{pk}`" if pk else "1"
+        table = self._primary_source(from_clause)
+        if not table:
+            return None
+        pk = self._db.primary_key_column(table)
+        return f"`{table}`.`{pk}`" if pk else None
@@ -19,6 +19,8 @@ File Format (supported)::
 
 Design Decisions:
     * The parser is a pure function (no side effects) to simplify testing.
+      Parses are memoised on (path, mtime, size), so re-loading an unchanged
+      file is free and an edited file is always re-read.
     * Regex is kept minimal; full SQL parsing is out of scope.
     * Duplicate table definitions: last wins (matching original behaviour).
     * Duplicate column names: last wins.
@@ -28,6 +30,7 @@ Design Decisions:
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import NamedTuple
 
@@ -41,6 +44,9 @@ ParsedSchema = dict[str, dict[str, str]]
 _TABLE_RE = re.compile(r"^\s*Table\s*:\s*(\w+)\s*$", re.IGNORECASE)
 _COL_RE = re.compile(r"^\s*[`'\"]?([\w_]+)[`'\"]?\s+(.+)")
 _COMMENT_RE = re.compile(r"^\s*(#|--)")
+_UNIQUE_RE = re.compile(r"\s+UNIQUE(?:\s+KEY)?\b", re.IGNORECASE)
+# Quoted literals (COMMENT / DEFAULT text); captured so re.split keeps them.
+_QUOTED_RE = re.compile(r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")""")
 
 
 class SchemaParseError(Exception):
@@ -83,6 +89,20 @@ def parse_schema_file(file_path: str | Path) -> ParsedSchema:
         log.warning("Schema file not found: %s", path)
         return {}
 
+    try:
+        stat = path.stat()
+    except OSError as exc:
+        raise SchemaParseError(f"Cannot read schema file '{path}': {exc}") from exc
+
+    cached = _parse_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    # Hand out a copy so callers can never mutate the cached result.
+    return {table: dict(cols) for table, cols in cached.items()}
+
+
+@lru_cache(maxsize=4)
+def _parse_cached(resolved_path: str, mtime_ns: int, size: int) -> ParsedSchema:
+    """Read and parse *resolved_path*; keyed on mtime/size so edits re-parse."""
+    path = Path(resolved_path)
     schema: ParsedSchema = {}
     current_table: str | None = None
     errors: list[str] = []
@@ -220,11 +240,53 @@ def generate_create_table_sql(
         if pk_cols:
             constraints.append(f"  PRIMARY KEY (`{pk_cols[0]}`)")
 
-    body = ",\n".join(col_lines)
-    if constraints:
-        body += ",\n" + ",\n".join(constraints)
-
+    body = ",\n".join(col_lines + constraints)
     return (
         f"CREATE TABLE `{table_name}` (\n{body}\n"
         f") ENGINE={engine} DEFAULT CHARSET={charset} COLLATE={collate};"
     )
+
+
+def defer_unique_keys(
+    table_name: str,
+    column_defs: dict[str, str],
+) -> tuple[dict[str, str], str | None]:
+    """
+    Move inline ``UNIQUE`` column constraints out of a table definition.
+
+    Bulk loads are much faster into a table without secondary indexes; the
+    indexes are then built once, sorted, by a single ``ALTER TABLE``. Primary
+    keys and ``AUTO_INCREMENT`` columns (which MySQL requires to be indexed)
+    are left inline.
+
+    Args:
+        table_name:  Target table name (unquoted).
+        column_defs: Ordered dict ``{col_name: definition_string}``.
+
+    Returns:
+        ``(reduced_defs, alter_sql)`` — the definitions without the deferred
+        ``UNIQUE`` keywords, and one ``ALTER TABLE … ADD UNIQUE`` statement
+        (``None`` when nothing was deferred). Inline ``UNIQUE`` names the index
+        after its column, and so does the ALTER.
+    """
+    reduced: dict[str, str] = {}
+    deferred: list[str] = []
+    for col_name, definition in column_defs.items():
+        # Odd-indexed parts are quoted literals; keywords are only looked
+        # for (and removed) in the parts between them.
+        parts = _QUOTED_RE.split(definition)
+        upper = " ".join(parts[::2]).upper()
+        if (
+            _UNIQUE_RE.search(upper)
+            and "PRIMARY KEY" not in upper
+            and "AUTO_INCREMENT" not in upper
+        ):
+            parts[::2] = [_UNIQUE_RE.sub("", part) for part in parts[::2]]
+            reduced[col_name] = "".join(parts)
+            deferred.append(f"ADD UNIQUE KEY `{col_name}` (`{col_name}`)")
+        else:
+            reduced[col_name] = definition
+
+    if not deferred:
+        return reduced, None
+    return reduced, f"ALTER TABLE `{table_name}` " + ", ".join(deferred) + ";"
@@ -14,7 +14,8 @@ Design Decisions:
 from __future__ import annotations
 
 import datetime
-import textwrap
+import string
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -178,7 +179,7 @@ def migrate_data() -> None:
             conn.commit()
             offset += BATCH_SIZE
             pct = rows_processed / total * 100 if total else 0
-            print(f"  Progress: {{rows_processed}}/{{total}} ({{{pct:.1f}}}%)")
+            print(f"  Progress: {{rows_processed}}/{{total}} ({{pct:.1f}}%)")
 
         print("\\nFinal commit…")
         conn.commit()
@@ -214,6 +215,13 @@ if __name__ == "__main__":
         print("Migration aborted.")
 """
 
+# The template pre-split into (literal, field) pieces, so a script can be
+# streamed to disk section by section instead of formatted into one string.
+_TEMPLATE_PARTS = [
+    (literal, field)
+    for literal, field, _spec, _conv in string.Formatter().parse(_SCRIPT_TEMPLATE)
+]
+
 
 def generate_script(
     source_table: str,
@@ -245,6 +253,51 @@ def generate_script(
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     out_dir = Path(output_dir)
 
+    sample_lines: list[str] = []
+    for i, row in enumerate(sample_rows[:2], start=1):
+        row_dict = dict(zip(column_names, row))
+        sample_lines.append(f"#  Row {i}: {row_dict}")
+
+    fields = dict(
+        source_table=source_table,
+        target_db_name=target_db_name,
+        target_schema_name=target_schema_name,
+        database=database_name,
+        timestamp=timestamp,
+        sample_data_comment="\n".join(sample_lines) or "#  (no rows found)",
+        **_schema_sections(
+            target_db_name, tuple(old_schema.items()), tuple(new_schema.items())
+        ),
+    )
+
+    filename = f"manual_migration_{source_table}_to_{target_schema_name}.py"
+    out_path = out_dir / filename
+
+    with out_path.open("w", encoding="utf-8") as fh:
+        for literal, field in _TEMPLATE_PARTS:
+            fh.write(literal)
+            if field is not None:
+                fh.write(fields[field])
+    log.info("Generated manual migration script: %s", out_path)
+    return out_path
+
+
+@lru_cache(maxsize=32)
+def _schema_sections(
+    target_db_name: str,
+    old_items: tuple[tuple[str, tuple], ...],
+    new_items: tuple[tuple[str, str], ...],
+) -> dict[str, str]:
+    """
+    Template fields derived only from the two schemas.
+
+    Keyed on the schema contents (in column order), so regenerating a script
+    for an unchanged table pair skips the CREATE/INSERT building; only the
+    timestamp and sample rows are recomputed by :func:`generate_script`.
+    """
+    old_schema = dict(old_items)
+    new_schema = dict(new_items)
+
     # --- Build inline comments ---
     old_schema_lines = [
         f"#   {col:<25} {details[1]:<20} NULL={details[2]} Key={details[3]}"
@@ -255,18 +308,11 @@ def generate_script(
         for col, defn in new_schema.items()
     ]
 
-    sample_lines: list[str] = []
-    for i, row in enumerate(sample_rows[:2], start=1):
-        row_dict = dict(zip(column_names, row))
-        sample_lines.append(f"#  Row {i}: {row_dict}")
-
     # --- Create SQL ---
     create_sql = generate_create_table_sql(target_db_name, new_schema)
 
     # --- INSERT template ---
     new_cols = list(new_schema.keys())
-    insert_cols_str = ", ".join(f"`{c}`" for c in new_cols)
-    placeholders_str = ", ".join(["%s"] * len(new_cols))
 
     # Best-effort value lines: use same-named column from source if available
     insert_lines: list[str] = []
@@ -279,26 +325,12 @@ def generate_script(
             insert_lines.append(
                 f"            None,  # TODO: provide value for new column '{col}'"
             )
-    insert_value_lines = "\n".join(insert_lines)
 
-    script = _SCRIPT_TEMPLATE.format(
-        source_table=source_table,
-        target_db_name=target_db_name,
-        target_schema_name=target_schema_name,
-        database=database_name,
-        timestamp=timestamp,
-        old_schema_comment="\n".join(old_schema_lines) or "#  (unavailable)",
-        new_schema_comment="\n".join(new_schema_lines) or "#  (unavailable)",
-        sample_data_comment="\n".join(sample_lines) or "#  (no rows found)",
-        create_sql=textwrap.indent(create_sql, ""),
-        insert_cols_str=insert_cols_str,
-        placeholders_str=placeholders_str,
-        insert_value_lines=insert_value_lines,
-    )
-
-    filename = f"manual_migration_{source_table}_to_{target_schema_name}.py"
-    out_path = out_dir / filename
-
-    out_path.write_text(script, encoding="utf-8")
-    log.info("Generated manual migration script: %s", out_path)
-    return out_path
+    return {
+        "old_schema_comment": "\n".join(old_schema_lines) or "#  (unavailable)",
+        "new_schema_comment": "\n".join(new_schema_lines) or "#  (unavailable)",
+        "create_sql": create_sql,
+        "insert_cols_str": ", ".join(f"`{c}`" for c in new_cols),
+        "placeholders_str": ", ".join(["%s"] * len(new_cols)),
+        "insert_value_lines": "\n".join(insert_lines),
+    }
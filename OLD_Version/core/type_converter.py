@@ -14,11 +14,14 @@ Design Decision:
     Pure functions with no side effects make this module trivially testable.
     The classification table encodes domain knowledge as data (sets + a
     simple priority model) rather than a deeply nested if/else tree.
+    Being pure, :func:`classify_conversion` is memoised: the same handful of
+    type pairs recur across every column of every table.
 """
 from __future__ import annotations
 
 import re
 from enum import Enum
+from functools import lru_cache
 
 
 class ConversionSafety(str, Enum):
@@ -78,6 +81,7 @@ def _category(base_type: str) -> str:
     return "other"
 
 
+@lru_cache(maxsize=1024)
 def classify_conversion(old_type: str, new_type: str) -> ConversionSafety:
     """
     Classify the safety of converting *old_type* data into *new_type*.
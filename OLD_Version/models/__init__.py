@@ -9,6 +9,8 @@ from models.mapping import (
     mapping_from_dict,
     load_mappings_from_file,
     save_mappings_to_file,
+    dump_mappings,
+    write_mappings_text,
 )
 
 __all__ = [
@@ -21,4 +23,6 @@ __all__ = [
     "mapping_from_dict",
     "load_mappings_from_file",
     "save_mappings_to_file",
+    "dump_mappings",
+    "write_mappings_text",
 ]
@@ -9,16 +9,38 @@ Design Decision:
     * A single source of truth for valid mapping types.
     * Easy serialisation / deserialisation with explicit to_dict / from_dict
       methods that include backward-compatibility upgrades for old JSON formats.
+    * Table and column names are interned on load: the same few names recur
+      as keys, targets and column-map entries across every mapping.
 """
 from __future__ import annotations
 
 import json
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
 
+def _intern(value: Any) -> Any:
+    """*value* interned if it is a string; anything else (e.g. null) as-is."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_map(raw: Any) -> Any:
+    """Copy of a name → name dict with keys and values interned."""
+    if not isinstance(raw, dict):
+        return raw
+    return {_intern(k): _intern(v) for k, v in raw.items()}
+
+
+def _intern_names(raw: Any) -> Any:
+    """Copy of a list of names with each one interned."""
+    if not isinstance(raw, list):
+        return raw
+    return [_intern(name) for name in raw]
+
+
 class MappingType(str, Enum):
     """Discriminator for the three supported migration strategies."""
     SINGLE = "single"
@@ -52,9 +74,9 @@ class SingleMapping:
     @staticmethod
     def from_dict(source_table: str, data: dict[str, Any]) -> "SingleMapping":
         return SingleMapping(
-            source_table=source_table,
-            target_schema_name=data.get("new_table_name_schema", source_table),
-            column_mappings=data.get("column_mappings", {}),
+            source_table=_intern(source_table),
+            target_schema_name=_intern(data.get("new_table_name_schema", source_table)),
+            column_mappings=_intern_map(data.get("column_mappings", {})),
         )
 
 
@@ -70,8 +92,8 @@ class SplitTarget:
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "SplitTarget":
         return SplitTarget(
-            schema_name=data.get("schema_name", ""),
-            column_mappings=data.get("column_mappings", {}),
+            schema_name=_intern(data.get("schema_name", "")),
+            column_mappings=_intern_map(data.get("column_mappings", {})),
         )
 
 
@@ -99,11 +121,12 @@ class SplitMapping:
         targets = [
             SplitTarget.from_dict(t) for t in data.get("new_tables", [])
         ]
-        return SplitMapping(source_table=source_table, targets=targets)
+        return SplitMapping(source_table=_intern(source_table), targets=targets)
 
     @property
     def target_schema_names(self) -> list[str]:
-        return [t.schema_name for t in self.targets]
+        """Distinct, non-empty target names in split order."""
+        return list(dict.fromkeys(t.schema_name for t in self.targets if t.schema_name))
 
     def column_mappings_for(self, schema_name: str) -> dict[str, str]:
         for t in self.targets:
@@ -148,11 +171,11 @@ class MergeMapping:
     @staticmethod
     def from_dict(merge_key: str, data: dict[str, Any]) -> "MergeMapping":
         return MergeMapping(
-            merge_key=merge_key,
-            source_tables=data.get("source_tables", []),
-            target_schema_name=data.get("new_table_name_schema", ""),
+            merge_key=_intern(merge_key),
+            source_tables=_intern_names(data.get("source_tables", [])),
+            target_schema_name=_intern(data.get("new_table_name_schema", "")),
             join_conditions=data.get("join_conditions", ""),
-            column_mappings=data.get("column_mappings", {}),
+            column_mappings=_intern_map(data.get("column_mappings", {})),
         )
 
     @property
@@ -180,7 +203,9 @@ def mapping_from_dict(key: str, data: Any) -> AnyMapping | None:
     """
     if isinstance(data, str):
         # Legacy: {"old_table": "new_table"}
-        return SingleMapping(source_table=key, target_schema_name=data)
+        return SingleMapping(
+            source_table=_intern(key), target_schema_name=_intern(data)
+        )
 
     if not isinstance(data, dict):
         return None
@@ -227,10 +252,27 @@ def load_mappings_from_file(path: Path) -> dict[str, AnyMapping]:
     for k, v in raw.items():
         m = mapping_from_dict(k, v)
         if m is not None:
-            result[k] = m
+            result[_intern(k)] = m
     return result
 
 
+def dump_mappings(mappings: dict[str, AnyMapping]) -> str:
+    """Serialise all mappings to the JSON text stored in the mapping file."""
+    return json.dumps({k: m.to_dict() for k, m in mappings.items()}, indent=4)
+
+
+def write_mappings_text(path: Path, text: str) -> None:
+    """
+    Write already-serialised mapping JSON atomically (write-then-rename).
+
+    Touches only *text*, never live mapping objects, so it is safe to run
+    on a background thread.
+    """
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(path)   # Atomic rename avoids partial writes corrupting the file
+
+
 def save_mappings_to_file(path: Path, mappings: dict[str, AnyMapping]) -> None:
     """
     Serialise all mappings to JSON and write atomically (write-then-rename).
@@ -239,7 +281,4 @@ def save_mappings_to_file(path: Path, mappings: dict[str, AnyMapping]) -> None:
         path:     Destination file path.
         mappings: Current mapping state keyed by source table / merge key.
     """
-    raw = {k: m.to_dict() for k, m in mappings.items()}
-    tmp = path.with_suffix(".tmp")
-    tmp.write_text(json.dumps(raw, indent=4), encoding="utf-8")
-    tmp.replace(path)   # Atomic rename avoids partial writes corrupting the file
+    write_mappings_text(path, dump_mappings(mappings))
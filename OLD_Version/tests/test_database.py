@@ -0,0 +1,168 @@
+"""
+tests/test_database.py
+-----------------------
+Unit tests for core/database.py (driver objects replaced by mocks).
+Run with: python -m pytest tests/
+"""
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.database import DatabaseManager
+
+
+@pytest.fixture
+def dm() -> DatabaseManager:
+    """A DatabaseManager wired to a mock connection and cursor."""
+    manager = DatabaseManager(host="localhost", port=3306, user="u", password="p")
+    manager._conn = MagicMock()
+    manager._cursor = MagicMock()
+    # Streaming reads (iter_rows) open their own cursor; route it to the same mock.
+    manager._conn.cursor.return_value = manager._cursor
+    return manager
+
+
+def _statements(dm: DatabaseManager) -> list[str]:
+    return [c.args[0] for c in dm._cursor.execute.call_args_list]
+
+
+def _serve(dm: DatabaseManager, rows: list[tuple]) -> None:
+    """Make every executed statement return *rows* via fetchall or fetchmany."""
+    pending: list[tuple] = []
+
+    def execute(*_args, **_kwargs) -> None:
+        pending[:] = rows
+
+    def fetchmany(size: int = 1) -> list[tuple]:
+        batch = pending[:size]
+        del pending[:size]
+        return batch
+
+    dm._cursor.execute.side_effect = execute
+    dm._cursor.fetchmany.side_effect = fetchmany
+    dm._cursor.fetchall.return_value = rows
+
+
+# ---------------------------------------------------------------------------
+# Schema metadata cache
+# ---------------------------------------------------------------------------
+
+class TestSchemaCache:
+    def test_list_tables_cached(self, dm: DatabaseManager) -> None:
+        _serve(dm, [("users",), ("orders",)])
+        assert dm.list_tables() == ["users", "orders"]
+        assert dm.list_tables() == ["users", "orders"]
+        assert _statements(dm).count("SHOW TABLES") == 1
+
+    def test_describe_cached_and_copied(self, dm: DatabaseManager) -> None:
+        _serve(dm, [("id", "int", "NO", "PRI", None, "")])
+        first = dm.describe_table("users")
+        first.pop("id")
+        assert "id" in dm.describe_table("users")
+        assert _statements(dm).count("DESCRIBE `users`") == 1
+
+    def test_ddl_invalidates(self, dm: DatabaseManager) -> None:
+        _serve(dm, [("users",)])
+        dm.list_tables()
+        dm.execute("CREATE TABLE `users_new` (`id` INT)")
+        dm.list_tables()
+        assert _statements(dm).count("SHOW TABLES") == 2
+
+    def test_describe_tables_one_query(self, dm: DatabaseManager) -> None:
+        _serve(dm, [
+            ("a", "id", "int", "NO", "PRI", None, ""),
+            ("b", "id", "int", "NO", "PRI", None, ""),
+            ("b", "a_id", "int", "YES", "MUL", None, ""),
+        ])
+        schemas = dm.describe_tables(["a", "b", "missing"])
+        assert list(schemas["b"]) == ["id", "a_id"]
+        assert schemas["missing"] == {}
+        assert dm.describe_table("a")["id"] == ("id", "int", "NO", "PRI", None, "")
+        assert len(_statements(dm)) == 1
+
+    def test_describe_all_tables_warms_cache(self, dm: DatabaseManager) -> None:
+        _serve(dm, [
+            ("a", "id", "int", "NO", "PRI", None, ""),
+            ("b", "id", "int", "NO", "PRI", None, ""),
+        ])
+        assert set(dm.describe_tables()) == {"a", "b"}
+        dm.describe_table("b")
+        assert len(_statements(dm)) == 1
+        assert "IN (" not in _statements(dm)[0]
+
+    def test_source_tables_skip_new_without_query(self, dm: DatabaseManager) -> None:
+        _serve(dm, [("users",), ("users_new",)])
+        assert dm.list_tables() == ["users", "users_new"]
+        assert dm.source_tables() == ["users"]
+        assert _statements(dm).count("SHOW TABLES") == 1
+
+    def test_close_drops_cache(self, dm: DatabaseManager) -> None:
+        _serve(dm, [("users",)])
+        dm.list_tables()
+        conn, cursor = dm._conn, dm._cursor
+        dm.close()
+        dm._conn, dm._cursor = conn, cursor
+        dm.list_tables()
+        assert _statements(dm).count("SHOW TABLES") == 2
+
+
+# ---------------------------------------------------------------------------
+# Row counts
+# ---------------------------------------------------------------------------
+
+class TestRowCounts:
+    def test_estimate_reads_metadata_not_table(self, dm: DatabaseManager) -> None:
+        dm._cursor.fetchone.return_value = (12345,)
+        assert dm.estimate_rows("orders") == 12345
+        (sql,) = _statements(dm)
+        assert "information_schema.TABLES" in sql
+        assert "COUNT(" not in sql
+
+    def test_estimate_unknown_table_is_zero(self, dm: DatabaseManager) -> None:
+        dm._cursor.fetchone.return_value = None
+        assert dm.estimate_rows("missing") == 0
+
+
+# ---------------------------------------------------------------------------
+# Warnings
+# ---------------------------------------------------------------------------
+
+class TestWarnings:
+    def test_no_round_trip_without_warnings(self, dm: DatabaseManager) -> None:
+        dm._cursor.warning_count = 0
+        assert dm.warnings() == []
+        dm._cursor.execute.assert_not_called()
+        dm._cursor.fetchwarnings.assert_not_called()
+
+    def test_driver_collected_warnings_returned(self, dm: DatabaseManager) -> None:
+        dm._cursor.warning_count = 1
+        dm._cursor.fetchwarnings.return_value = [("Warning", 1265, "Data truncated")]
+        assert dm.warnings() == [("Warning", 1265, "Data truncated")]
+        dm._cursor.execute.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Clone pool
+# ---------------------------------------------------------------------------
+
+class TestClonePool:
+    def test_clone_opens_single_session_pool_once(self, dm: DatabaseManager) -> None:
+        with patch("core.database.MySQLConnectionPool") as pool_cls:
+            dm.clone()
+            dm.clone()
+        pool_cls.assert_called_once()
+        assert pool_cls.call_args.kwargs["pool_size"] == 1
+
+    def test_reserve_grows_pool(self, dm: DatabaseManager) -> None:
+        with patch("core.database.MySQLConnectionPool") as pool_cls:
+            pool_cls.return_value.pool_size = 1
+            dm.clone()
+            small = dm._pool
+            pool_cls.return_value = MagicMock(pool_size=4)
+            dm.reserve_sessions(4)
+            dm.reserve_sessions(2)
+        assert pool_cls.call_count == 2
+        assert pool_cls.call_args.kwargs["pool_size"] == 4
+        small._remove_connections.assert_called_once()
@@ -7,11 +7,12 @@ Run with: python -m pytest tests/
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
 from core.mapping_store import MappingStore
-from models.mapping import SingleMapping, SplitMapping, SplitTarget
+from models.mapping import MergeMapping, SingleMapping, SplitMapping, SplitTarget
 
 
 @pytest.fixture
@@ -67,6 +68,20 @@ class TestMappingStorePersistence:
         store.save()
         assert path.exists()
 
+    def test_null_names_still_load(self, tmp_path: Path) -> None:
+        path = tmp_path / "mappings.json"
+        path.write_text(
+            '{"t": {"type": "single", "new_table_name_schema": null,'
+            ' "column_mappings": {"a": null}}}',
+            encoding="utf-8",
+        )
+        store = MappingStore(path)
+        store.load()
+        m = store.get("t")
+        assert isinstance(m, SingleMapping)
+        assert m.target_schema_name is None
+        assert m.column_mappings == {"a": None}
+
 
 class TestMappingStoreSplitMaps:
     def test_set_split(self, tmp_store: MappingStore) -> None:
@@ -111,6 +126,12 @@ class TestColumnMappings:
         assert isinstance(m, SingleMapping)
         assert "old" not in m.column_mappings
 
+    def test_remap_evicts_previous_source(self, tmp_store: MappingStore) -> None:
+        tmp_store.set_single("tbl", "tbl_new")
+        tmp_store.set_column_mapping("tbl", old_col="a", new_col="x")
+        tmp_store.set_column_mapping("tbl", old_col="b", new_col="x")
+        assert tmp_store.get("tbl").column_mappings == {"b": "x"}
+
     def test_set_column_mapping_split_target(self, tmp_store: MappingStore) -> None:
         mapping = SplitMapping(
             source_table="src",
@@ -131,3 +152,71 @@ class TestAllMappedTargets:
         targets = tmp_store.all_mapped_targets(exclude_key="a")
         assert "target_y" in targets
         assert "target_x" not in targets
+
+    def test_shared_target_kept_when_excluding_one_owner(self, tmp_store: MappingStore) -> None:
+        tmp_store.set_single("a", "target_x")
+        tmp_store.set_single("b", "target_x")
+        assert "target_x" in tmp_store.all_mapped_targets(exclude_key="a")
+
+    def test_index_follows_mutations(self, tmp_store: MappingStore) -> None:
+        tmp_store.set_single("a", "target_x")
+        assert tmp_store.all_mapped_targets() == {"target_x"}
+        tmp_store.set_single("a", "target_z")
+        tmp_store.set_mapping("s", SplitMapping("s", [SplitTarget("p", {}), SplitTarget("q", {})]))
+        assert tmp_store.all_mapped_targets() == {"target_z", "p", "q"}
+        tmp_store.remove("s")
+        assert tmp_store.all_mapped_targets() == {"target_z"}
+
+    def test_index_patched_not_rebuilt(self, tmp_store: MappingStore) -> None:
+        tmp_store.set_single("a", "x")
+        index = tmp_store._index()
+        tmp_store.set_single("b", "x")
+        tmp_store.remove("a")
+        assert tmp_store._index() is index
+        assert index == {"x": {"b"}}
+
+
+class TestAutoMap:
+    def test_maps_matching_names(self, tmp_store: MappingStore) -> None:
+        db = MagicMock()
+        db.source_tables.return_value = ["users", "legacy"]
+        schema = {"users": {}, "users_new": {}, "orders": {}}
+        assert tmp_store.auto_map(db, schema) == 1
+        assert tmp_store.all_mapped_targets() == {"users"}
+
+    def test_merge_sources_not_auto_mapped(self, tmp_store: MappingStore) -> None:
+        tmp_store.set_mapping("m", MergeMapping("m", ["users", "profiles"], "people", "", {}))
+        db = MagicMock()
+        db.source_tables.return_value = ["users", "profiles", "orders"]
+        assert tmp_store.auto_map(db, {"users": {}, "profiles": {}, "orders": {}}) == 1
+        assert tmp_store.get("users") is None
+
+
+class TestDeferredSaves:
+    def test_burst_coalesced_into_one_write(self, tmp_store: MappingStore) -> None:
+        pending: list = []
+        tmp_store.defer_saves(pending.append)
+        tmp_store.save = MagicMock(wraps=tmp_store.save)
+        tmp_store.set_single("a", "x")
+        tmp_store.set_single("b", "y")
+        assert len(pending) == 1
+        tmp_store.save.assert_not_called()
+        assert tmp_store.all_mapped_targets() == {"x", "y"}
+        pending.pop()()
+        tmp_store.save.assert_called_once()
+
+    def test_load_flushes_pending_changes(self, tmp_path: Path) -> None:
+        store = MappingStore(tmp_path / "m.json")
+        store.defer_saves(lambda flush: None)
+        store.set_single("a", "x")
+        store.load()
+        assert store.get("a") is not None
+
+    def test_background_write_lands_before_reload(self, tmp_path: Path) -> None:
+        store = MappingStore(tmp_path / "m.json")
+        store.defer_saves(lambda flush: flush(), background_io=True)
+        store.set_single("a", "x")
+        store.load()
+        store.close()
+        assert (tmp_path / "m.json").exists()
+        assert store.get("a") is not None
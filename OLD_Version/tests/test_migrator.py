@@ -6,12 +6,14 @@ Run with: python -m pytest tests/
 """
 from __future__ import annotations
 
+from typing import Iterator
 from unittest.mock import MagicMock, patch, call
 from pathlib import Path
 
 import pytest
 
-from core.migrator import MigrationEngine, MigrationPlan, MigrationResult
+from core.database import DatabaseError
+from core.migrator import MigrationEngine, MigrationError, MigrationPlan, MigrationResult
 from core.type_converter import ConversionSafety
 from models.mapping import SingleMapping, SplitMapping, SplitTarget
 
@@ -30,6 +32,7 @@ def mock_db() -> MagicMock:
     }
     db.primary_key_column.return_value = "id"
     db.count_rows.return_value = 3
+    db.estimate_rows.return_value = 3
     db.table_exists.return_value = False
     db.execute.return_value = MagicMock(fetchall=lambda: [(1, "Alice", "a@example.com")])
     db.transaction.return_value = MagicMock(__enter__=MagicMock(return_value=None), __exit__=MagicMock(return_value=False))
@@ -132,3 +135,215 @@ class TestMigrationResult:
         assert result.warnings == []
         assert result.errors == []
         assert result.elapsed_seconds == 0.0
+
+
+# ---------------------------------------------------------------------------
+# Copy strategies
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def copy_engine(mock_db: MagicMock, source_schema) -> MigrationEngine:
+    mock_db.describe_table.return_value = {
+        "id": ("id", "int", "NO", "PRI", None, "auto_increment"),
+        "name": ("name", "varchar(100)", "YES", "", None, ""),
+        "email": ("email", "varchar(200)", "YES", "", None, ""),
+    }
+    mock_db.fetchone.return_value = (1, 1)
+    mock_db.warnings.return_value = []
+    mock_db.rowcount = 3
+    return MigrationEngine(db=mock_db, schema=source_schema, mappings={})
+
+
+def _executed(mock_db: MagicMock, prefix: str) -> list[str]:
+    return [c.args[0] for c in mock_db.execute.call_args_list if c.args[0].startswith(prefix)]
+
+
+def _stream(rows: list[tuple], events: list[str] | None = None) -> Iterator[tuple]:
+    """Stand-in for DatabaseManager.iter_rows; records when it is drained."""
+    try:
+        yield from rows
+    finally:
+        if events is not None:
+            events.append("drained")
+
+
+class TestCopyStrategies:
+    def test_plain_table_copied_in_one_statement(self, copy_engine, mock_db) -> None:
+        mapping = SingleMapping(source_table="users", target_schema_name="users_new")
+        result = copy_engine.migrate_single(mapping)
+        inserts = _executed(mock_db, "INSERT")
+        assert len(inserts) == 1
+        assert "LIMIT" not in inserts[0]
+        assert result.rows_copied == 3
+        assert result.success
+
+    def test_session_checks_restored(self, copy_engine, mock_db) -> None:
+        mapping = SingleMapping(source_table="users", target_schema_name="users_new")
+        copy_engine.migrate_single(mapping)
+        restores = [
+            c for c in mock_db.execute.call_args_list
+            if c.args[0].startswith("SET SESSION") and len(c.args) > 1
+        ]
+        assert len(restores) == 2
+
+    def test_join_copy_pages_by_key_range(self, copy_engine, mock_db) -> None:
+        copy_engine._batch_size = 2
+        mock_db.fetchone.side_effect = [(2,), None]
+        mock_db.rowcount = 2
+        result = MigrationResult(table_name="m_new", success=False)
+        copied = copy_engine._copy_batched(
+            source_ref="merge_m",
+            target_db_name="m_new",
+            insert_cols=["`id`"],
+            select_clause="`users`.`id`",
+            from_clause="`users` JOIN `orders` ON `orders`.`uid` = `users`.`id`",
+            result=result,
+        )
+        inserts = [c for c in mock_db.execute.call_args_list if c.args[0].startswith("INSERT")]
+        assert copied == 4
+        assert len(inserts) == 2
+        assert all("OFFSET" not in c.args[0] for c in inserts)
+        assert inserts[0].args[1] == (2,)
+        assert inserts[1].args[1] == (2,)
+        assert "`users`.`id` > %s" in inserts[1].args[0]
+
+    def test_join_where_parenthesised_before_key_range(self, copy_engine, mock_db) -> None:
+        mock_db.fetchone.side_effect = [None]
+        copy_engine._copy_batched(
+            source_ref="merge_m",
+            target_db_name="m_new",
+            insert_cols=["`id`"],
+            select_clause="`users`.`id`",
+            from_clause="`users` JOIN `orders` ON `orders`.`uid` = `users`.`id` WHERE a = 1 OR b = 2",
+            result=MigrationResult(table_name="m_new", success=False),
+        )
+        (insert,) = _executed(mock_db, "INSERT")
+        assert "WHERE (a = 1 OR b = 2) AND 1 = 1" in insert
+
+    def test_split_targets_copy_on_own_connections(self, copy_engine, mock_db, source_schema) -> None:
+        source_schema["contacts_new"] = {"id": "BIGINT", "email": "VARCHAR(200)"}
+        workers = [MagicMock(**{
+            "table_exists.return_value": False,
+            "fetchone.return_value": (1, 1),
+            "warnings.return_value": [],
+            "rowcount": 3,
+        }) for _ in range(2)]
+        mock_db.clone.side_effect = workers
+        mapping = SplitMapping(
+            source_table="users",
+            targets=[SplitTarget("users_new", {}), SplitTarget("contacts_new", {})],
+        )
+        results = copy_engine.migrate_split(mapping)
+        assert [r.table_name for r in results] == ["users_new_new", "contacts_new_new"]
+        assert all(r.success for r in results)
+        mock_db.reserve_sessions.assert_called_once_with(2)
+        assert not _executed(mock_db, "INSERT")
+        for w in workers:
+            assert len(_executed(w, "INSERT")) == 1
+            w.close.assert_called_once()
+
+    def test_split_refuses_unsafe_target_before_copying(self, copy_engine, mock_db, source_schema) -> None:
+        source_schema["contacts_new"] = {"id": "BIGINT", "email": "DATE"}
+        mapping = SplitMapping(
+            source_table="users",
+            targets=[SplitTarget("users_new", {}), SplitTarget("contacts_new", {})],
+        )
+        with pytest.raises(MigrationError, match="Unsafe"):
+            copy_engine.migrate_split(mapping)
+        mock_db.clone.assert_not_called()
+        assert not _executed(mock_db, "CREATE")
+
+    def test_fast_unsafe_also_skips_binlog(self, copy_engine, mock_db) -> None:
+        mock_db.fetchone.return_value = (1, 1, 1)
+        mapping = SingleMapping(source_table="users", target_schema_name="users_new")
+        with patch("core.migrator.BULK_LOAD_FAST_UNSAFE", True):
+            copy_engine.migrate_single(mapping)
+        assert "SET SESSION sql_log_bin = 0" in _executed(mock_db, "SET SESSION")
+
+    def test_join_copy_streams_through_reader(self, copy_engine, mock_db) -> None:
+        copy_engine._batch_size = 2
+        reader = MagicMock()
+        reader.iter_rows.return_value = _stream([(i,) for i in range(5)])
+        mock_db.clone.return_value = reader
+        result = MigrationResult(table_name="m_new", success=False)
+        copy_engine._copy_via_client(
+            source_ref="merge_m",
+            target_db_name="m_new",
+            insert_cols=["`id`"],
+            select_clause="`users`.`id`",
+            from_clause="`users` JOIN `orders` ON `orders`.`uid` = `users`.`id`",
+            result=result,
+        )
+        batches = [c.args[1] for c in mock_db.executemany.call_args_list]
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert mock_db.executemany.call_args.args[0].startswith("INSERT INTO `m_new` (`id`) VALUES")
+        reader.close.assert_called_once()
+        assert not result.errors
+
+    def test_failed_write_drains_stream_before_closing_reader(self, copy_engine, mock_db) -> None:
+        copy_engine._batch_size = 2
+        events: list[str] = []
+        reader = MagicMock()
+        reader.iter_rows.return_value = _stream([(i,) for i in range(5)], events)
+        reader.close.side_effect = lambda: events.append("closed")
+        mock_db.clone.return_value = reader
+        mock_db.executemany.side_effect = DatabaseError("Data too long")
+        result = MigrationResult(table_name="m_new", success=False)
+        copy_engine._copy_via_client(
+            source_ref="merge_m",
+            target_db_name="m_new",
+            insert_cols=["`id`"],
+            select_clause="`users`.`id`",
+            from_clause="`users` JOIN `orders` ON `orders`.`uid` = `users`.`id`",
+            result=result,
+        )
+        assert events == ["drained", "closed"]
+        assert result.errors
+
+    def test_wide_join_copy_shrinks_batches(self, copy_engine, mock_db) -> None:
+        reader = MagicMock()
+        reader.iter_rows.return_value = _stream([])
+        mock_db.clone.return_value = reader
+        cols = [f"`c{i}`" for i in range(1000)]
+        copy_engine._copy_via_client(
+            source_ref="merge_m",
+            target_db_name="m_new",
+            insert_cols=cols,
+            select_clause=", ".join(cols),
+            from_clause="`a` JOIN `b` ON `a`.`id` = `b`.`id`",
+            result=MigrationResult(table_name="m_new", success=False),
+        )
+        assert reader.iter_rows.call_args.kwargs["batch_size"] == 65
+
+    def test_split_checks_targets_in_one_query(self, copy_engine, mock_db, source_schema) -> None:
+        source_schema["contacts_new"] = {"id": "BIGINT"}
+        mock_db.existing_tables.return_value = {"contacts_new_new"}
+        mapping = SplitMapping(
+            source_table="users",
+            targets=[SplitTarget("users_new", {}), SplitTarget("contacts_new", {})],
+        )
+        with pytest.raises(MigrationError, match="contacts_new_new"):
+            copy_engine.migrate_split(mapping)
+        mock_db.existing_tables.assert_called_once_with(["users_new_new", "contacts_new_new"])
+        mock_db.table_exists.assert_not_called()
+        assert not _executed(mock_db, "CREATE")
+
+    def test_outfile_copy_when_enabled(self, copy_engine, mock_db) -> None:
+        mock_db.fetchone.side_effect = [(1, 1), ("/var/lib/mysql-files/", "/tmp")]
+        mapping = SingleMapping(source_table="users", target_schema_name="users_new")
+        with patch("core.migrator.SUPPORTS_OUTFILE", True):
+            result = copy_engine.migrate_single(mapping)
+        dump = [q for q in _executed(mock_db, "SELECT") if "OUTFILE" in q]
+        load = [c for c in mock_db.execute.call_args_list if c.args[0].startswith("LOAD DATA")]
+        assert len(dump) == 1
+        assert load[0].args[1][0].startswith("/var/lib/mysql-files/users_new_new_")
+        assert not _executed(mock_db, "INSERT")
+        assert result.rows_copied == 3
+
+    def test_outfile_disabled_falls_back(self, copy_engine, mock_db) -> None:
+        mock_db.fetchone.side_effect = [(1, 1), (None, "/tmp")]
+        mapping = SingleMapping(source_table="users", target_schema_name="users_new")
+        with patch("core.migrator.SUPPORTS_OUTFILE", True):
+            copy_engine.migrate_single(mapping)
+        assert not _executed(mock_db, "LOAD DATA")
+        assert len(_executed(mock_db, "INSERT")) == 1
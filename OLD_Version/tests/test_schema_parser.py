@@ -13,6 +13,7 @@ import pytest
 
 from core.schema_parser import (
     ColumnDefinition,
+    defer_unique_keys,
     generate_create_table_sql,
     parse_schema_file,
 )
@@ -98,6 +99,28 @@ class TestParseSchemaFile:
         result = parse_schema_file(f)
         assert "Things" in result
 
+    def test_repeat_parse_returns_independent_copy(self, tmp_path: Path) -> None:
+        f = _write_schema(tmp_path, """\
+            Table: t
+              x INT
+        """)
+        first = parse_schema_file(f)
+        first["t"]["y"] = "INT"
+        assert parse_schema_file(f) == {"t": {"x": "INT"}}
+
+    def test_edited_file_is_reparsed(self, tmp_path: Path) -> None:
+        f = _write_schema(tmp_path, """\
+            Table: t
+              x INT
+        """)
+        parse_schema_file(f)
+        _write_schema(tmp_path, """\
+            Table: t
+              x INT
+              yy VARCHAR(10)
+        """)
+        assert "yy" in parse_schema_file(f)["t"]
+
 
 # ---------------------------------------------------------------------------
 # generate_create_table_sql
@@ -133,3 +156,38 @@ class TestGenerateCreateTableSql:
         # Should not try to add PRIMARY KEY(...) as a separate constraint
         # when it is already inline (implementation-specific; verify no duplicate)
         assert sql.upper().count("PRIMARY KEY") == 1
+
+
+# ---------------------------------------------------------------------------
+# defer_unique_keys
+# ---------------------------------------------------------------------------
+
+class TestDeferUniqueKeys:
+    def test_unique_moved_to_alter(self) -> None:
+        defs, alter = defer_unique_keys("t_new", {
+            "id": "INT AUTO_INCREMENT PRIMARY KEY",
+            "email": "VARCHAR(255) NOT NULL UNIQUE",
+            "code": "CHAR(4) UNIQUE KEY DEFAULT 'x'",
+        })
+        assert defs["email"] == "VARCHAR(255) NOT NULL"
+        assert defs["code"] == "CHAR(4) DEFAULT 'x'"
+        assert alter == (
+            "ALTER TABLE `t_new` ADD UNIQUE KEY `email` (`email`), "
+            "ADD UNIQUE KEY `code` (`code`);"
+        )
+
+    def test_keyed_columns_left_inline(self) -> None:
+        schema = {"id": "INT AUTO_INCREMENT UNIQUE", "val": "VARCHAR(20)"}
+        defs, alter = defer_unique_keys("t_new", schema)
+        assert defs == schema
+        assert alter is None
+
+    def test_unique_inside_quotes_ignored(self) -> None:
+        schema = {
+            "code": "VARCHAR(10) NOT NULL COMMENT 'a unique code'",
+            "tag": 'VARCHAR(10) DEFAULT "UNIQUE KEY" UNIQUE',
+        }
+        defs, alter = defer_unique_keys("t_new", schema)
+        assert defs["code"] == schema["code"]
+        assert defs["tag"] == 'VARCHAR(10) DEFAULT "UNIQUE KEY"'
+        assert alter == "ALTER TABLE `t_new` ADD UNIQUE KEY `tag` (`tag`);"
@@ -25,6 +25,7 @@ from core.mapping_store import MappingStore
 from core.schema_parser import parse_schema_file, ParsedSchema
 from core.migrator import MigrationEngine, MigrationError, MigrationResult
 from core.script_generator import generate_script
+from core.type_converter import get_base_type
 from logger import get_logger
 from models.mapping import (
     AnyMapping,
@@ -35,6 +36,13 @@ from models.mapping import (
 
 log = get_logger(__name__)
 
+# Column types whose sample values are cut to _SAMPLE_LOB_CHARS in scripts.
+_LOB_TYPES = frozenset({
+    "tinytext", "text", "mediumtext", "longtext",
+    "tinyblob", "blob", "mediumblob", "longblob", "json",
+})
+_SAMPLE_LOB_CHARS = 80
+
 
 class AppController:
     """
@@ -49,6 +57,7 @@ class AppController:
         db           Connected DatabaseManager.
         store        MappingStore (loaded from file).
         schema       ParsedSchema dict (loaded from schema file).
+        schema_names Sorted target table names of ``schema`` (computed once).
         schema_path  Path to the currently loaded schema file.
     """
 
@@ -56,6 +65,7 @@ class AppController:
         self.db: DatabaseManager | None = None
         self.store: MappingStore = MappingStore(CONFIG.migration.mapping_file)
         self.schema: ParsedSchema = {}
+        self.schema_names: list[str] = []
         self.schema_path: str = ""
         self._root: tk.Tk | None = None
         self._main_win = None  # MainWindow instance (set after login)
@@ -104,9 +114,12 @@ class AppController:
             )
 
         self.schema = schema
+        self.schema_names = sorted(schema)
         self.schema_path = schema_path
         self.store.load()  # Reload mappings on fresh DB/schema load
         self.store.auto_map(self.db, self.schema)
+        # Warm the DESCRIBE cache for every table in one query.
+        self.db.describe_tables()
         log.info(
             "Loaded DB='%s', schema='%s' (%d tables).",
             database_name, schema_path, len(schema),
@@ -118,6 +131,7 @@ class AppController:
         mapping_key: str,
         confirm_lossy: bool,
         progress_cb=None,
+        db: DatabaseManager | None = None,
     ) -> list[MigrationResult]:
         """
         Execute a migration for the given mapping key.
@@ -126,6 +140,8 @@ class AppController:
             mapping_key:   Key in the MappingStore (source table or merge key).
             confirm_lossy: If True, proceed despite lossy type conversions.
             progress_cb:   Optional ``(msg, current, total)`` progress callback.
+            db:            Session to migrate on (e.g. a clone when running
+                           off the Tk thread); defaults to :attr:`db`.
 
         Returns:
             List of MigrationResult (one per target table created).
@@ -133,10 +149,11 @@ class AppController:
         Raises:
             MigrationError: On pre-flight or execution failures.
         """
-        assert self.db is not None
+        db = db or self.db
+        assert db is not None
 
         engine = MigrationEngine(
-            db=self.db,
+            db=db,
             schema=self.schema,
             mappings=self.store.all(),
             progress_cb=progress_cb,
@@ -183,9 +200,14 @@ class AppController:
             return [engine.analyse_single(mapping)]
         if isinstance(mapping, SplitMapping):
             plans = []
+            db_schema = self.db.describe_table(mapping.source_table)
             for target in mapping.targets:
                 try:
-                    plans.append(engine.analyse_single(mapping, target_schema_name=target.schema_name))
+                    plans.append(engine.analyse_single(
+                        mapping,
+                        target_schema_name=target.schema_name,
+                        db_schema=db_schema,
+                    ))
                 except MigrationError:
                     pass
             return plans
@@ -222,11 +244,17 @@ class AppController:
         old_schema = self.db.describe_table(source_table)
         new_schema = self.schema[target]
 
-        # Fetch sample rows
+        # Fetch sample rows (they only end up in a comment, so LOBs are
+        # truncated server-side rather than shipped whole)
         sample_rows: list[tuple] = []
-        col_names: list[str] = []
+        col_names: list[str] = list(old_schema)
+        select_list = ", ".join(
+            f"LEFT(`{c}`, {_SAMPLE_LOB_CHARS}) AS `{c}`"
+            if get_base_type(str(row[1])) in _LOB_TYPES else f"`{c}`"
+            for c, row in old_schema.items()
+        ) or "*"
         try:
-            self.db.execute(f"SELECT * FROM `{source_table}` LIMIT 2")
+            self.db.execute(f"SELECT {select_list} FROM `{source_table}` LIMIT 2")
             sample_rows = self.db.fetchall()
             col_names = [d[0] for d in self.db.description]
         except Exception:
@@ -244,8 +272,16 @@ class AppController:
         )
         return str(path)
 
+    def notify(self, message: str) -> None:
+        """Report a routine success without a modal dialog (status bar)."""
+        if self._main_win is not None:
+            self._main_win.flash_status(message)
+        else:
+            log.info(message)
+
     def cleanup(self) -> None:
-        """Close database connection gracefully."""
+        """Write any pending mapping changes and close the database connection."""
+        self.store.close()
         if self.db:
             self.db.close()
             self.db = None
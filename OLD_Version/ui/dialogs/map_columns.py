@@ -6,6 +6,7 @@ Supports both single mappings and split mappings (target selection via Combobox)
 """
 from __future__ import annotations
 
+import bisect
 import tkinter as tk
 from tkinter import messagebox, ttk
 from typing import Callable
@@ -14,6 +15,10 @@ from models.mapping import SingleMapping, SplitMapping
 from ui.utils import center_window, ToolTip
 
 
+def _map_line(src_col: str, tgt_col: str) -> str:
+    return f"{src_col}  →  {tgt_col}"
+
+
 class MapColumnsDialog:
     """
     Column mapping dialog.
@@ -57,6 +62,10 @@ class MapColumnsDialog:
             messagebox.showerror("Error", f"Cannot read schema for '{source_table}'.", parent=parent)
             return
         self._db_cols: list[str] = sorted(db_schema.keys())
+        # Sorted "src → tgt" display lines per target, kept in step by
+        # add/remove (bisect) so a refresh or target switch doesn't re-sort.
+        self._lines: dict[str, list[str]] = {}
+        self._pending_refresh: str | None = None  # after() id (target switch)
 
         self._win = win = tk.Toplevel(parent)
         win.title(f"Map Columns: {source_table}")
@@ -83,7 +92,7 @@ class MapColumnsDialog:
         self._tgt_combo.pack(side=tk.LEFT)
         if self._target_names:
             self._tgt_combo.current(0)
-        self._tgt_var.trace_add("write", lambda *_: self._refresh_display())
+        self._tgt_var.trace_add("write", lambda *_: self._schedule_refresh())
 
         # Mapping area
         main = ttk.Frame(win, padding=(10, 0, 10, 0))
@@ -131,6 +140,12 @@ class MapColumnsDialog:
 
         self._refresh_display()
 
+    def _schedule_refresh(self) -> None:
+        """Debounce target switches (e.g. arrow-key traversal) into one refresh."""
+        if self._pending_refresh is not None:
+            self._win.after_cancel(self._pending_refresh)
+        self._pending_refresh = self._win.after(50, self._refresh_display)
+
     def _current_target(self) -> str:
         return self._tgt_var.get()
 
@@ -144,6 +159,7 @@ class MapColumnsDialog:
         return {}
 
     def _refresh_display(self) -> None:
+        self._pending_refresh = None
         tgt = self._current_target()
         if not tgt:
             return
@@ -163,9 +179,12 @@ class MapColumnsDialog:
         if unmapped_tgt:
             self._tgt_col_combo.current(0)
 
+        lines = self._lines.get(tgt)
+        if lines is None or len(lines) != len(col_maps):
+            # First view of this target, or the store evicted an entry.
+            lines = self._lines[tgt] = sorted(_map_line(s, t) for s, t in col_maps.items())
         self._map_list.delete(0, tk.END)
-        for src_c, tgt_c in sorted(col_maps.items()):
-            self._map_list.insert(tk.END, f"{src_c}  →  {tgt_c}")
+        self._map_list.insert(tk.END, *lines)
 
     def _add_mapping(self) -> None:
         src_col = self._src_var.get().strip()
@@ -180,6 +199,9 @@ class MapColumnsDialog:
             new_col=tgt_col,
             split_target=split_target,
         )
+        lines = self._lines.get(self._current_target())
+        if lines is not None:
+            bisect.insort(lines, _map_line(src_col, tgt_col))
         # Reload mapping from store
         self._mapping = self._ctrl.store.get(self._source)
         self._refresh_display()
@@ -197,6 +219,9 @@ class MapColumnsDialog:
             new_col=tgt_col,
             split_target=split_target,
         )
+        lines = self._lines.get(self._current_target())
+        if lines is not None and entry in lines:
+            lines.remove(entry)
         self._mapping = self._ctrl.store.get(self._source)
         self._refresh_display()
         self._on_done()
@@ -8,6 +8,7 @@ and column mappings based on foreign key / name matching heuristics.
 from __future__ import annotations
 
 import datetime
+import re
 import tkinter as tk
 from tkinter import messagebox, ttk
 from typing import Callable
@@ -15,6 +16,9 @@ from typing import Callable
 from models.mapping import MergeMapping
 from ui.utils import center_window, ToolTip, scrolled_text
 
+# SQL line comments, e.g. the "-- TODO" lines written by Auto-Generate.
+_SQL_COMMENT_RE = re.compile(r"--[^\n]*")
+
 
 class MapMergeDialog:
     """
@@ -36,10 +40,10 @@ class MapMergeDialog:
         self._on_done = on_done
 
         try:
-            all_db_tables = sorted(controller.db.list_tables())
+            all_db_tables = sorted(controller.db.source_tables())
         except Exception:
             all_db_tables = []
-        all_schema_names = sorted(controller.schema.keys())
+        all_schema_names = controller.schema_names
 
         self._win = win = tk.Toplevel(parent)
         win.title("Merge Multiple Tables into One")
@@ -62,8 +66,7 @@ class MapMergeDialog:
         self._src_list = tk.Listbox(src_lf, selectmode=tk.MULTIPLE, exportselection=False, height=6)
         sb_src = ttk.Scrollbar(src_lf, orient=tk.VERTICAL, command=self._src_list.yview)
         self._src_list.config(yscrollcommand=sb_src.set)
-        for t in all_db_tables:
-            self._src_list.insert(tk.END, t)
+        self._src_list.insert(tk.END, *all_db_tables)
         self._src_list.grid(row=0, column=0, sticky="nsew")
         sb_src.grid(row=0, column=1, sticky="ns")
         ToolTip(self._src_list, "Hold Ctrl/Cmd to select multiple tables. The FIRST selected table is the primary (FROM table).")
@@ -128,25 +131,33 @@ class MapMergeDialog:
         target_schema = self._ctrl.schema.get(target, {})
         db = self._ctrl.db
 
-        # Fetch source schemas
-        src_schemas: dict[str, dict] = {}
-        for s in sources:
-            src_schemas[s] = db.describe_table(s)
+        # Fetch source schemas (one round trip for all uncached sources)
+        src_schemas = db.describe_tables(sources)
+
+        # Lower-cased column name → canonical name, per source (built once)
+        lc_cols = {
+            t: {c.lower(): c for c in reversed(list(sch))}
+            for t, sch in src_schemas.items()
+        }
+
+        # First primary-key column per source, taken from the rows fetched above
+        primary_keys = {
+            t: next((c for c, row in sch.items() if row[3] == "PRI"), None)
+            for t, sch in src_schemas.items()
+        }
 
         # --- Attempt JOIN generation ---
         join_lines: list[str] = []
         for i in range(1, len(sources)):
             prev = sources[i - 1]
             curr = sources[i]
-            prev_schema = src_schemas.get(prev, {})
-            curr_schema = src_schemas.get(curr, {})
             # Heuristic: look for a column in curr that references prev's PK
-            prev_pk = db.primary_key_column(prev)
-            join_col = None
-            for col in curr_schema:
-                if col.lower() in (f"{prev}_id", f"{prev.rstrip('s')}_id", f"fk_{prev}_id"):
-                    join_col = col
-                    break
+            prev_pk = primary_keys.get(prev)
+            lc_prev = prev.lower()
+            candidates = (f"{lc_prev}_id", f"{lc_prev.rstrip('s')}_id", f"fk_{lc_prev}_id")
+            join_col = next(
+                (lc_cols[curr][c] for c in candidates if c in lc_cols[curr]), None
+            )
             if prev_pk and join_col:
                 join_lines.append(f"INNER JOIN `{curr}` ON `{prev}`.`{prev_pk}` = `{curr}`.`{join_col}`")
             else:
@@ -156,16 +167,18 @@ class MapMergeDialog:
         self._join_text.insert("1.0", "\n".join(join_lines) if join_lines else "-- No JOIN generated. Enter manually.")
 
         # --- Attempt column mapping generation ---
+        # Column name → first source table (in join order) that has it
+        owner: dict[str, str] = {}
+        for src_tbl, src_sch in src_schemas.items():
+            for col in src_sch:
+                owner.setdefault(col, src_tbl)
+
         map_lines: list[str] = []
         for target_col in target_schema:
-            # Look for same-named col across source tables
-            found = False
-            for src_tbl, src_sch in src_schemas.items():
-                if target_col in src_sch:
-                    map_lines.append(f"{src_tbl}.{target_col} -> {target_col}")
-                    found = True
-                    break
-            if not found:
+            src_tbl = owner.get(target_col)
+            if src_tbl is not None:
+                map_lines.append(f"{src_tbl}.{target_col} -> {target_col}")
+            else:
                 map_lines.append(f"# TODO: ?.{target_col} -> {target_col}")
 
         self._map_text.delete("1.0", tk.END)
@@ -188,19 +201,29 @@ class MapMergeDialog:
         join_conditions = "\n".join(
             line for line in join_raw.splitlines() if not line.strip().startswith("#")
         ).strip()
+        if not _SQL_COMMENT_RE.sub("", join_conditions).strip():
+            messagebox.showerror(
+                "Error",
+                "Enter the JOIN conditions linking the source tables.",
+                parent=self._win,
+            )
+            return
 
         map_raw = self._map_text.get("1.0", tk.END).strip()
         col_mappings: dict[str, str] = {}
         parse_errors: list[str] = []
+        src_set = set(sources)
         for line in map_raw.splitlines():
             line = line.strip()
             if not line or line.startswith("#"):
                 continue
-            if "->" not in line:
+            left, sep, right = line.partition("->")
+            src_spec = left.strip()
+            # Specs naming an unselected table would only fail later, at migration.
+            if not sep or src_spec.partition(".")[0] not in src_set:
                 parse_errors.append(line)
                 continue
-            left, right = line.split("->", 1)
-            col_mappings[left.strip()] = right.strip()
+            col_mappings[src_spec] = right.strip()
 
         if parse_errors:
             messagebox.showwarning(
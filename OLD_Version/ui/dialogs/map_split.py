@@ -5,6 +5,7 @@ Dialog for configuring a split mapping: one source → multiple targets.
 """
 from __future__ import annotations
 
+import bisect
 import tkinter as tk
 from tkinter import messagebox, ttk
 from typing import Callable
@@ -44,10 +45,13 @@ class MapSplitDialog:
         )
         current_set = set(self._targets)
 
-        all_schema = sorted(controller.schema.keys())
+        all_schema = controller.schema_names
         taken = controller.store.all_mapped_targets(exclude_key=source_table)
-        self._available_all = all_schema  # full list (for repopulating combo)
         self._taken = taken
+        # Sorted schema names still offered in the combo; kept in step with
+        # add/remove via bisect rather than re-filtered on every edit.
+        self._available = [n for n in all_schema if n not in current_set and n not in taken]
+        self._in_schema = set(all_schema)
 
         self._win = win = tk.Toplevel(parent)
         win.title(f"Split '{source_table}' into Multiple Targets")
@@ -67,19 +71,17 @@ class MapSplitDialog:
         self._listbox.config(yscrollcommand=sb.set)
         self._listbox.grid(row=0, column=0, sticky="nsew")
         sb.grid(row=0, column=1, sticky="ns")
-        for t in self._targets:
-            self._listbox.insert(tk.END, t)
+        self._listbox.insert(tk.END, *self._targets)
 
         # --- Add / remove ---
         ctrl_frame = ttk.Frame(win)
         ctrl_frame.pack(fill=tk.X, padx=12, pady=4)
         self._add_var = tk.StringVar(win)
-        available = [n for n in all_schema if n not in current_set and n not in taken]
         self._add_combo = ttk.Combobox(
-            ctrl_frame, textvariable=self._add_var, values=available, state="readonly", width=26
+            ctrl_frame, textvariable=self._add_var, values=self._available, state="readonly", width=26
         )
         self._add_combo.grid(row=0, column=0, padx=(0, 4))
-        if available:
+        if self._available:
             self._add_combo.current(0)
         ttk.Button(ctrl_frame, text="Add Target", command=self._add_target).grid(row=0, column=1, padx=4)
         ttk.Button(ctrl_frame, text="Remove Selected", command=self._remove_target).grid(row=0, column=2, padx=4)
@@ -99,6 +101,9 @@ class MapSplitDialog:
             return
         self._targets.append(name)
         self._listbox.insert(tk.END, name)
+        i = bisect.bisect_left(self._available, name)
+        if i < len(self._available) and self._available[i] == name:
+            del self._available[i]
         self._refresh_combo()
 
     def _remove_target(self) -> None:
@@ -108,13 +113,13 @@ class MapSplitDialog:
         name = self._listbox.get(sel[0])
         self._targets.remove(name)
         self._listbox.delete(sel[0])
+        if name in self._in_schema and name not in self._taken:
+            bisect.insort(self._available, name)
         self._refresh_combo()
 
     def _refresh_combo(self) -> None:
-        current_set = set(self._targets)
-        available = [n for n in self._available_all if n not in current_set and n not in self._taken]
-        self._add_combo["values"] = available
-        if available:
+        self._add_combo["values"] = self._available
+        if self._available:
             self._add_combo.current(0)
 
     def _confirm(self) -> None:
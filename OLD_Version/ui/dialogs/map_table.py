@@ -35,10 +35,9 @@ class MapTableDialog:
         self._on_done = on_done
 
         store = controller.store
-        schema = controller.schema
 
         # Gather available targets
-        all_schema_names = sorted(schema.keys())
+        all_schema_names = controller.schema_names
         current_mapping = store.get(source_table)
         current_target = (
             current_mapping.target_schema_name
@@ -99,10 +98,6 @@ class MapTableDialog:
     def _unmap(self) -> None:
         removed = self._ctrl.store.remove(self._source)
         if removed:
-            messagebox.showinfo(
-                "Unmapped",
-                f"Mapping for '{self._source}' removed.",
-                parent=self._win,
-            )
+            self._ctrl.notify(f"Mapping for '{self._source}' removed.")
         self._on_done()
         self._win.destroy()
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import messagebox, ttk, filedialog
+from typing import NamedTuple
 
 from config import CONFIG
 from core.database import DatabaseError
@@ -32,6 +33,9 @@ from ui.utils import (
     set_window_icon,
     ToolTip,
     ProgressDialog,
+    listbox_fill,
+    run_in_background,
+    tree_insert_rows,
 )
 
 log = get_logger(__name__)
@@ -47,7 +51,8 @@ _COLOUR_MERGE = "darkgreen"
 _COLOUR_DONE = "black"
 _COLOUR_ORPHAN = "grey"
 
-# Schema diff tag names → background colours
+# Schema diff tag names → background colours.  Configured once per tree when
+# it is built (and reused for the legend), never per selection.
 _DIFF_TAGS: dict[str, str] = {
     "matching": "#E0E0E0",
     "changed": "#FFFACD",
@@ -57,6 +62,16 @@ _DIFF_TAGS: dict[str, str] = {
 }
 
 
+class _ColRow(NamedTuple):
+    """One row of the schema comparison trees (DESCRIBE column order)."""
+    name: str
+    type: str
+    null: str
+    key: str
+    default: str
+    extra: str
+
+
 class MainWindow:
     """
     Primary application window shown after successful login.
@@ -77,6 +92,15 @@ class MainWindow:
         self._constraint_vars: list[tk.BooleanVar] = []
         self._create_btn: ttk.Button | None = None
         self._status_var = tk.StringVar(value="Ready.")
+        # Coalesced list refresh (see _schedule_refresh)
+        self._refresh_pending = False
+        self._refresh_show: str | None = None
+        self._pending_select: str | None = None  # after() id (list selection)
+        self._migrating = False  # a background copy is running (see _on_create)
+        # Batch mapping-file writes into one per idle burst
+        self._ctrl.store.defer_saves(
+            lambda flush: self._root.after(200, flush), background_io=True
+        )
 
         self._build_ui()
         self._root.protocol("WM_DELETE_WINDOW", self._on_close)
@@ -229,12 +253,8 @@ class MainWindow:
         # Legend
         legend_frame = ttk.Frame(mid)
         legend_frame.grid(row=1, column=0, sticky="w", pady=(0, 2))
-        legend_items = [
-            ("Matching", "#E0E0E0"), ("Changed", "#FFFACD"),
-            ("Renamed", "#ADD8E6"), ("Removed", "#FFB6C1"), ("Added", "#90EE90"),
-        ]
-        for i, (label, colour) in enumerate(legend_items):
-            box = ttk.Label(legend_frame, width=10, text=label, background=colour,
+        for i, (tag, colour) in enumerate(_DIFF_TAGS.items()):
+            box = ttk.Label(legend_frame, width=10, text=tag.capitalize(), background=colour,
                             relief=tk.RIDGE, font=(CONFIG.ui.font_family, 8))
             box.grid(row=0, column=i, padx=2)
 
@@ -356,6 +376,7 @@ class MainWindow:
     def _refresh(self) -> None:
         if not self._ctrl.db or not self._ctrl.db.is_connected:
             return
+        self._ctrl.db.invalidate_schema_cache()
         self._refresh_table_lists()
         self._set_status("Refreshed.")
 
@@ -364,6 +385,13 @@ class MainWindow:
     # ------------------------------------------------------------------
 
     def _on_old_select(self, _event: tk.Event | None = None) -> None:
+        """Debounce selection changes (e.g. arrow-key traversal) into one redraw."""
+        if self._pending_select is not None:
+            self._root.after_cancel(self._pending_select)
+        self._pending_select = self._root.after(50, self._show_selected_old)
+
+    def _show_selected_old(self) -> None:
+        self._pending_select = None
         sel = self._list_old.curselection()
         if not sel:
             return
@@ -386,7 +414,7 @@ class MainWindow:
             parent=self._root,
             source_table=sel,
             controller=self._ctrl,
-            on_done=self._refresh_table_lists,
+            on_done=self._schedule_refresh,
         )
 
     def _map_split(self) -> None:
@@ -399,7 +427,7 @@ class MainWindow:
             parent=self._root,
             source_table=sel,
             controller=self._ctrl,
-            on_done=self._refresh_table_lists,
+            on_done=self._schedule_refresh,
         )
 
     def _map_merge(self) -> None:
@@ -410,7 +438,7 @@ class MainWindow:
         MapMergeDialog(
             parent=self._root,
             controller=self._ctrl,
-            on_done=self._refresh_table_lists,
+            on_done=self._schedule_refresh,
         )
 
     def _map_columns(self) -> None:
@@ -423,7 +451,7 @@ class MainWindow:
             parent=self._root,
             source_table=sel,
             controller=self._ctrl,
-            on_done=lambda: (self._refresh_table_lists(), self._show_schema_for(sel)),
+            on_done=lambda: self._schedule_refresh(show_table=sel),
         )
 
     def _view_old_data(self) -> None:
@@ -451,19 +479,25 @@ class MainWindow:
         messagebox.showinfo("Info", "Select a table from the '_new' list or a mapped source.", parent=self._root)
 
     def _open_data_viewer(self, table_name: str) -> None:
+        from ui.dialogs.view_data import MAX_ROWS_DISPLAY, ViewDataDialog
+        db = self._ctrl.db
         try:
-            self._ctrl.db.execute(f"SELECT * FROM `{table_name}` LIMIT 10000")
-            rows = self._ctrl.db.fetchall()
-            cols = [d[0] for d in self._ctrl.db.description]
+            db.execute(f"SELECT * FROM `{table_name}` LIMIT %s", (MAX_ROWS_DISPLAY,))
+            rows = db.fetchall()
+            cols = [d[0] for d in db.description]
+            types = [d[1] for d in db.description]
+            total = db.count_rows(table_name) if len(rows) == MAX_ROWS_DISPLAY else len(rows)
         except Exception as exc:
             messagebox.showerror("Error", f"Could not read table '{table_name}':\n{exc}", parent=self._root)
             return
-        from ui.dialogs.view_data import ViewDataDialog
         ViewDataDialog(
             parent=self._root,
             table_name=table_name,
             columns=cols,
             data=rows,
+            total_rows=total,
+            export_rows=lambda: db.iter_rows(f"SELECT * FROM `{table_name}`"),
+            column_types=types,
         )
 
     def _generate_script(self) -> None:
@@ -507,34 +541,61 @@ class MainWindow:
             if not messagebox.askyesno("Data Loss Warning", msg, parent=self._root):
                 return
 
+        if self._pending_select is not None:
+            self._root.after_cancel(self._pending_select)
+            self._pending_select = None
         pdlg = ProgressDialog(self._root, "Migrating…")
         pdlg.show()
-        try:
-            results = self._ctrl.migrate_mapping(
-                mapping_key=sel,
-                confirm_lossy=True,
-                progress_cb=pdlg.update,
-            )
-        except MigrationError as exc:
-            pdlg.close()
-            messagebox.showerror("Migration Error", str(exc), parent=self._root)
-            return
-        except Exception as exc:
+        self._migrating = True
+
+        # The copy runs off the Tk thread on its own session, so the UI can
+        # keep using the shared connection while it runs.
+        def work(progress_cb) -> list:
+            db = self._ctrl.db.clone()
+            try:
+                return self._ctrl.migrate_mapping(
+                    mapping_key=sel,
+                    confirm_lossy=True,
+                    progress_cb=progress_cb,
+                    db=db,
+                )
+            finally:
+                db.close()
+
+        def finish() -> None:
+            self._migrating = False
             pdlg.close()
+            if self._ctrl.db:
+                # Target tables were created on the worker session.
+                self._ctrl.db.invalidate_schema_cache()
+
+        def on_done(results: list) -> None:
+            finish()
+            success_count = sum(1 for r in results if r.success)
+            lines = [str(r) for r in results]
+            title = "Migration Complete" if success_count == len(results) else "Partial Failure"
+            messagebox.showinfo(title, "\n\n".join(lines), parent=self._root)
+            self._refresh_table_lists()
+            self._reset_checklist()
+
+        def on_error(exc: BaseException) -> None:
+            finish()
+            if isinstance(exc, MigrationError):
+                messagebox.showerror("Migration Error", str(exc), parent=self._root)
+                return
+            log.error(
+                "Unexpected error during migration of '%s'", sel,
+                exc_info=(type(exc), exc, exc.__traceback__),
+            )
             messagebox.showerror("Unexpected Error", str(exc), parent=self._root)
-            log.exception("Unexpected error during migration of '%s'", sel)
-            return
-        finally:
-            pdlg.close()
-
-        # Show summary
-        success_count = sum(1 for r in results if r.success)
-        lines = [str(r) for r in results]
-        title = "Migration Complete" if success_count == len(results) else "Partial Failure"
-        messagebox.showinfo(title, "\n\n".join(lines), parent=self._root)
 
-        self._refresh_table_lists()
-        self._reset_checklist()
+        run_in_background(
+            self._root,
+            work,
+            on_done=on_done,
+            on_error=on_error,
+            on_progress=pdlg.update,
+        )
 
     # ------------------------------------------------------------------
     # Schema display
@@ -558,49 +619,55 @@ class MainWindow:
             item if item in self._ctrl.schema else None
         )
 
+        old_rows: dict[str, _ColRow] = {}
         for col, details in db_schema.items():
-            row = list(details) + [""] * (6 - len(details))
-            if row[4] is None:
-                row[4] = "NULL"
-            self._tree_old.insert("", tk.END, values=row, iid=f"old_{col}")
+            cells = tuple("NULL" if v is None else v for v in details[:6])
+            old_rows[col] = _ColRow(*cells, *("",) * (6 - len(cells)))
+        tree_insert_rows(self._tree_old, list(old_rows.values()), [f"old_{c}" for c in old_rows])
 
         self._frame_old.config(text=f"Original Schema: {item}")
         new_schema = self._ctrl.schema.get(target_name, {}) if target_name else {}
         self._frame_new.config(text=f"Target Schema: {target_name or '(not mapped)'}")
 
+        new_rows: dict[str, _ColRow] = {}
         for col, defn in new_schema.items():
             cd = parse_column_definition(col, defn)
-            null_str = "YES" if cd.is_nullable else "NO"
-            key_str = "PRI" if cd.is_primary_key else ("UNI" if cd.is_unique else "")
-            extra = "auto_increment" if cd.has_auto_increment else ""
-            default = str(cd.default_value) if cd.default_value is not None else "NULL"
-            self._tree_new.insert("", tk.END, values=(col, cd.base_type, null_str, key_str, default, extra), iid=f"new_{col}")
+            new_rows[col] = _ColRow(
+                name=col,
+                type=cd.base_type,
+                null="YES" if cd.is_nullable else "NO",
+                key="PRI" if cd.is_primary_key else ("UNI" if cd.is_unique else ""),
+                default=str(cd.default_value) if cd.default_value is not None else "NULL",
+                extra="auto_increment" if cd.has_auto_increment else "",
+            )
+        tree_insert_rows(self._tree_new, list(new_rows.values()), [f"new_{c}" for c in new_rows])
 
         if isinstance(m, SingleMapping):
-            self._apply_diff_highlights(db_schema, new_schema, m.column_mappings)
+            self._apply_diff_highlights(old_rows, new_rows, m.column_mappings)
 
     def _apply_diff_highlights(
         self,
-        db_schema: dict,
-        new_schema: dict[str, str],
+        old_rows: dict[str, _ColRow],
+        new_rows: dict[str, _ColRow],
         col_maps: dict[str, str],
     ) -> None:
         from core.type_converter import get_base_type
         reverse = {v: k for k, v in col_maps.items()}
-        all_old = set(db_schema.keys())
+        all_old = set(old_rows.keys())
         processed_old: set[str] = set()
 
-        for new_col, new_def in new_schema.items():
+        for new_col, new_row in new_rows.items():
             old_col = reverse.get(new_col, new_col)
-            if old_col not in db_schema:
+            old_row = old_rows.get(old_col)
+            if old_row is None:
                 self._tag_item(self._tree_new, f"new_{new_col}", "added")
                 continue
 
             processed_old.add(old_col)
-            old_details = db_schema[old_col]
-            old_type_base = get_base_type(str(old_details[1]))
-            new_type_base = get_base_type(new_def.split()[0])
-            is_different = old_type_base != new_type_base
+            # Identical rows need no type parsing; otherwise compare base types.
+            is_different = old_row != new_row and (
+                get_base_type(str(old_row.type)) != new_row.type
+            )
 
             tag = "renamed" if old_col != new_col else ("changed" if is_different else "matching")
             self._tag_item(self._tree_old, f"old_{old_col}", tag)
@@ -616,15 +683,36 @@ class MainWindow:
             pass
 
     def _clear_trees(self) -> None:
-        for row in self._tree_old.get_children():
-            self._tree_old.delete(row)
-        for row in self._tree_new.get_children():
-            self._tree_new.delete(row)
+        # One delete per tree rather than one per row
+        self._tree_old.delete(*self._tree_old.get_children())
+        self._tree_new.delete(*self._tree_new.get_children())
 
     # ------------------------------------------------------------------
     # Table list population
     # ------------------------------------------------------------------
 
+    def _schedule_refresh(self, show_table: str | None = None) -> None:
+        """
+        Refresh the table lists once the event loop is idle.
+
+        Mapping dialogs call back after every edit; a burst of edits is
+        coalesced into a single repaint.  *show_table*, if given, has its
+        schema re-shown after the lists are rebuilt.
+        """
+        if show_table is not None:
+            self._refresh_show = show_table
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self._root.after_idle(self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self) -> None:
+        show_table, self._refresh_show = self._refresh_show, None
+        self._refresh_pending = False
+        self._refresh_table_lists()
+        if show_table is not None:
+            self._show_schema_for(show_table)
+
     def _refresh_table_lists(self) -> None:
         if not self._ctrl.db or not self._ctrl.db.is_connected:
             return
@@ -641,37 +729,36 @@ class MainWindow:
         store = self._ctrl.store
         tables_in_merges = store.tables_in_merges()
 
+        # Rows are collected first and inserted (with colours) in one Tcl
+        # call per list.
+        old_rows: list[tuple[str, str]] = []
+        new_rows: list[tuple[str, str]] = []
+
         # --- Merge entries first ---
         for key, m in sorted(store.all_merges().items()):
-            self._list_old.insert(tk.END, m.display_name)
-            idx = self._list_old.size() - 1
-            self._list_old.itemconfig(idx, {"fg": _COLOUR_MERGE})
+            old_rows.append((m.display_name, _COLOUR_MERGE))
+
+        ordered_tables = sorted(all_tables)
 
         # --- Individual source tables ---
-        for table in sorted(all_tables):
+        for table in ordered_tables:
             if table.endswith("_new") or table in tables_in_merges:
                 continue
 
             m = store.get(table)
-            colour = self._get_table_color(table, m, all_tables, schema)
-            self._list_old.insert(tk.END, table)
-            idx = self._list_old.size() - 1
-            self._list_old.itemconfig(idx, {"fg": colour})
+            old_rows.append((table, self._get_table_color(table, m, all_tables, schema)))
 
         # --- _new tables ---
-        for table in sorted(all_tables):
+        mapped_targets = store.all_mapped_targets()
+        for table in ordered_tables:
             if not table.endswith("_new"):
                 continue
             base = table[:-4]
-            is_orphan = base not in schema and not any(
-                (isinstance(m, SingleMapping) and m.target_schema_name == base) or
-                (isinstance(m, SplitMapping) and base in m.target_schema_names) or
-                (isinstance(m, MergeMapping) and m.target_schema_name == base)
-                for m in store.all().values()
-            )
-            self._list_new.insert(tk.END, table)
-            idx = self._list_new.size() - 1
-            self._list_new.itemconfig(idx, {"fg": _COLOUR_ORPHAN if is_orphan else "black"})
+            is_orphan = base not in schema and base not in mapped_targets
+            new_rows.append((table, _COLOUR_ORPHAN if is_orphan else "black"))
+
+        listbox_fill(self._list_old, old_rows)
+        listbox_fill(self._list_new, new_rows)
 
     def _get_table_color(self, table: str, mapping, all_tables: set, schema: dict) -> str:
         if mapping is None:
@@ -714,7 +801,24 @@ class MainWindow:
         self._status_var.set(msg)
         log.debug("Status: %s", msg)
 
+    def flash_status(self, msg: str, timeout_ms: int = 4000) -> None:
+        """Show *msg* in the status bar, restoring the previous text afterwards."""
+        previous = self._status_var.get()
+        self._set_status(msg)
+
+        def restore() -> None:
+            if self._status_var.get() == msg:
+                self._status_var.set(previous)
+
+        self._root.after(timeout_ms, restore)
+
     def _on_close(self) -> None:
+        if self._migrating and not messagebox.askyesno(
+            "Migration Running",
+            "A migration is still copying data and will be cut off mid-batch.\n\nQuit anyway?",
+            parent=self._root,
+        ):
+            return
         self._ctrl.cleanup()
         self._root.destroy()
 
@@ -1,13 +1,16 @@
 """
 ui/utils.py
 -----------
-Shared UI utilities: window centering, theming, icon loading, tooltip helpers.
+Shared UI utilities: window centering, theming, icon loading, tooltip helpers,
+and running long operations off the Tk thread.
 """
 from __future__ import annotations
 
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk
-from typing import Any
+from typing import Any, Callable
 
 from config import CONFIG
 from logger import get_logger
@@ -134,7 +137,7 @@ class ProgressDialog:
 
         dlg = ProgressDialog(parent, "Copying data…")
         dlg.show()
-        # … pass dlg.update as progress_cb …
+        # … pass dlg.update as on_progress to run_in_background …
         dlg.close()
     """
 
@@ -151,6 +154,8 @@ class ProgressDialog:
         win.resizable(False, False)
         win.transient(self._parent)
         win.grab_set()
+        # Only close() dismisses it; the title-bar X would drop the grab.
+        win.protocol("WM_DELETE_WINDOW", lambda: None)
         center_window(win, 380, 130)
 
         ttk.Label(win, textvariable=self._label_var, wraplength=340).pack(pady=(16, 4), padx=16)
@@ -167,7 +172,8 @@ class ProgressDialog:
     def update(self, message: str, current: int, total: int) -> None:
         self._label_var.set(message)
         if total > 0:
-            self._progress_var.set(current / total * 100)
+            # Totals may be estimates (see DatabaseManager.estimate_rows)
+            self._progress_var.set(min(current / total * 100, 100))
         else:
             self._progress_var.set(0)
         if self._win:
@@ -180,6 +186,100 @@ class ProgressDialog:
             self._win = None
 
 
+def run_in_background(
+    root: tk.Misc,
+    work: Callable[[Callable[[str, int, int], None]], Any],
+    on_done: Callable[[Any], None],
+    on_error: Callable[[BaseException], None],
+    on_progress: Callable[[str, int, int], None] | None = None,
+    poll_ms: int = 100,
+) -> None:
+    """
+    Run *work* on a daemon thread while the Tk event loop keeps running.
+
+    *work* receives a thread-safe ``(message, current, total)`` progress
+    callback. Progress, the result and any exception are handed back through
+    a queue that is drained on the Tk thread every *poll_ms*, so *on_done*,
+    *on_error* and *on_progress* may touch widgets freely.
+    """
+    events: queue.Queue[tuple[str, Any]] = queue.Queue()
+
+    def report(message: str, current: int, total: int) -> None:
+        events.put(("progress", (message, current, total)))
+
+    def target() -> None:
+        try:
+            events.put(("done", work(report)))
+        except BaseException as exc:  # handed to on_error on the Tk thread
+            events.put(("error", exc))
+
+    def poll() -> None:
+        while True:
+            try:
+                kind, payload = events.get_nowait()
+            except queue.Empty:
+                root.after(poll_ms, poll)
+                return
+            if kind == "progress":
+                if on_progress:
+                    on_progress(*payload)
+            elif kind == "done":
+                on_done(payload)
+                return
+            else:
+                on_error(payload)
+                return
+
+    threading.Thread(target=target, daemon=True).start()
+    root.after(poll_ms, poll)
+
+
+# One Tcl-side loop per call; rows arrive as a native Tcl list of lists,
+# so values need no quoting or escaping.
+_TREE_INSERT_ALL = "{w rows} {foreach r $rows {$w insert {} end -values $r}}"
+_TREE_INSERT_ALL_IDS = (
+    "{w rows ids} {foreach r $rows i $ids {$w insert {} end -id $i -values $r}}"
+)
+
+
+def tree_insert_rows(
+    tree: ttk.Treeview,
+    rows: list[tuple[str, ...]],
+    iids: list[str] | None = None,
+) -> None:
+    """
+    Append *rows* to *tree* in a single Python→Tcl call.
+
+    Equivalent to ``tree.insert("", tk.END, values=row)`` for each row (with
+    ``iid=iids[n]`` when *iids* is given), but avoids one interpreter round
+    trip per row on large tables.
+    """
+    if not rows:
+        return
+    if iids is None:
+        tree.tk.call("apply", _TREE_INSERT_ALL, str(tree), tuple(rows))
+    else:
+        tree.tk.call("apply", _TREE_INSERT_ALL_IDS, str(tree), tuple(rows), tuple(iids))
+
+
+_LISTBOX_FILL = (
+    "{w rows} {foreach r $rows {"
+    "$w insert end [lindex $r 0]; $w itemconfigure end -foreground [lindex $r 1]"
+    "}}"
+)
+
+
+def listbox_fill(listbox: tk.Listbox, rows: list[tuple[str, str]]) -> None:
+    """
+    Append ``(text, foreground colour)`` *rows* to *listbox* in one Tcl call.
+
+    Equivalent to ``insert`` + ``itemconfig(fg=...)`` per row, without the two
+    interpreter round trips per row on databases with many tables.
+    """
+    if rows:
+        listbox.tk.call("apply", _LISTBOX_FILL, str(listbox), tuple(rows))
+
+
 def scrolled_listbox(
     parent: tk.Widget,
     **listbox_kwargs: Any,
@@ -27,13 +27,12 @@ class Planner:
             
         created_chunks = self.chunk_repo.bulk_create_chunks(db, chunks_data)
         
-        # Publish chunks
-        for chunk in created_chunks:
-            self.queue_service.publish_chunk(
-                job_id=job_id,
-                table_id=table_id,
-                chunk_id=chunk.id
-            )
+        # Publish chunks (one Redis round trip for the whole table)
+        self.queue_service.publish_chunks(
+            job_id=job_id,
+            table_id=table_id,
+            chunk_ids=[chunk.id for chunk in created_chunks]
+        )
         
         logger.info("Published chunks", count=len(created_chunks))
         return created_chunks
@@ -11,12 +11,18 @@ class RecoveryManager:
 
     def check_stuck_chunks(self, db: Session):
         logger.info("Checking for stuck chunks")
-        running_chunks = self.chunk_repo.get_running_chunks(db)
-        
-        for chunk in running_chunks:
-            # Here we would check if updated_at is > 15 mins ago
-            # For simplicity, assuming all found are stuck
-            self.chunk_repo.update_chunk_status(db, chunk.id, ChunkStatus.FAILED)
+        # Here we would check if updated_at is > 15 mins ago
+        # For simplicity, assuming all found are stuck
+        # (read the keys before the commit expires the loaded chunks)
+        stuck = [
+            (chunk.job_id, chunk.table_id, chunk.id)
+            for chunk in self.chunk_repo.get_running_chunks(db)
+        ]
+        self.chunk_repo.update_chunks_status(
+            db, [chunk_id for _, _, chunk_id in stuck], ChunkStatus.FAILED
+        )
+
+        for job_id, table_id, chunk_id in stuck:
             # Increment retry count logic goes here
-            self.queue_service.publish_retry(chunk.job_id, chunk.table_id, chunk.id)
-            logger.warning("Requeued stuck chunk", chunk_id=chunk.id)
+            self.queue_service.publish_retry(job_id, table_id, chunk_id)
+            logger.warning("Requeued stuck chunk", chunk_id=chunk_id)
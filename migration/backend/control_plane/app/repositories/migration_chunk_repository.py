@@ -38,6 +38,16 @@ class MigrationChunkRepository:
             db.refresh(chunk)
         return chunk
 
+    def update_chunks_status(self, db: Session, chunk_ids: List[str], status: str) -> int:
+        """Set *status* on many chunks with one UPDATE and one commit."""
+        if not chunk_ids:
+            return 0
+        count = db.query(MigrationChunk).filter(
+            MigrationChunk.id.in_(chunk_ids)
+        ).update({MigrationChunk.status: status}, synchronize_session=False)
+        db.commit()
+        return count
+
     def get_pending_chunks(self, db: Session, job_id: str) -> List[MigrationChunk]:
         return db.query(MigrationChunk).filter(MigrationChunk.job_id == job_id, MigrationChunk.status == "PENDING").all()
 
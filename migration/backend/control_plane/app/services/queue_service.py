@@ -14,6 +14,22 @@ class QueueService:
         logger.info("Publishing chunk to queue", chunk_id=chunk_id)
         redis_client.lpush(Queues.MIGRATION_QUEUE, json.dumps(message, default=str))
 
+    def publish_chunks(self, job_id: str, table_id: str, chunk_ids, priority: int = 1):
+        """Publish many chunks with one LPUSH (same queue order as one call each)."""
+        messages = [
+            json.dumps({
+                "job_id": str(job_id),
+                "table_id": str(table_id),
+                "chunk_id": str(chunk_id),
+                "priority": priority
+            }, default=str)
+            for chunk_id in chunk_ids
+        ]
+        if not messages:
+            return
+        logger.info("Publishing chunks to queue", job_id=job_id, count=len(messages))
+        redis_client.lpush(Queues.MIGRATION_QUEUE, *messages)
+
     def publish_retry(self, job_id: str, table_id: str, chunk_id: str):
         message = {
             "job_id": job_id,
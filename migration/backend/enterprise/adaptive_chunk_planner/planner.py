@@ -31,6 +31,7 @@ Usage:
 import math
 import datetime
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from dataclasses import dataclass
 from sqlalchemy.orm import Session
@@ -56,6 +57,10 @@ THROUGHPUT_BENCHMARKS = {
 # If avg row size cannot be determined, assume this default
 DEFAULT_AVG_ROW_BYTES = 512
 
+# Tables analyzed concurrently by compute_all_tables (one source
+# connection each at a time — keep well under the source's max_connections)
+PLANNING_WORKERS = 8
+
 
 @dataclass
 class ChunkPlan:
@@ -99,7 +104,7 @@ class AdaptiveChunkPlanner:
 
         # ── Step 3: Get PK stats ──────────────────────────────────────────────
         pk_min, pk_max, pk_distribution = self._analyze_pk(
-            source_config, table_name, pk_column
+            source_config, table_name, pk_column, row_count=row_count
         )
 
         # ── Step 4: Select strategy and compute chunk size ────────────────────
@@ -166,19 +171,27 @@ class AdaptiveChunkPlanner:
         pk_columns = pk_columns or {}
         plans = {}
 
-        for table_name in table_names:
-            pk_col = pk_columns.get(table_name, "id")
+        # Source-side analysis (counts, row sizes, PK MIN/MAX) is independent
+        # per table: run it in parallel. The metadata Session is not
+        # thread-safe, so plans are persisted below, on this thread, in order.
+        def analyze(table_name):
+            return self.compute(
+                table_name=table_name,
+                source_config=source_config,
+                pk_column=pk_columns.get(table_name, "id"),
+                source_db_type=source_db_type,
+                target_db_type=target_db_type,
+            )
+
+        with ThreadPoolExecutor(max_workers=PLANNING_WORKERS) as pool:
+            futures = [(t, pool.submit(analyze, t)) for t in table_names]
+
+        for table_name, future in futures:
             try:
-                plan = self.compute(
-                    table_name=table_name,
-                    source_config=source_config,
-                    db=db,
-                    job_id=job_id,
-                    pk_column=pk_col,
-                    source_db_type=source_db_type,
-                    target_db_type=target_db_type,
-                )
+                plan = future.result()
                 plans[table_name] = plan
+                if db and job_id:
+                    self._save_plan(db, job_id, plan)
 
                 # Update migration_tables with computed chunk size
                 if db:
@@ -370,8 +383,8 @@ class AdaptiveChunkPlanner:
             cursor.close()
             conn.close()
 
-    def _analyze_pk(self, config: dict, table_name: str, pk_column: str):
-        """Returns (pk_min, pk_max, distribution_type)."""
+    def _analyze_pk(self, config: dict, table_name: str, pk_column: str, row_count: int = None):
+        """Returns (pk_min, pk_max, distribution_type). Pass *row_count* if known."""
         conn   = self._connect(config)
         cursor = conn.cursor()
         engine = config.get("engine", "mysql").lower()
@@ -402,7 +415,8 @@ class AdaptiveChunkPlanner:
                 return None, None, "uuid"
 
             pk_range = pk_max - pk_min + 1
-            row_count = self._get_row_count(config, table_name, pk_column)
+            if row_count is None:
+                row_count = self._get_row_count(config, table_name, pk_column)
 
             if row_count > 0:
                 fill_ratio = row_count / pk_range if pk_range > 0 else 1.0
@@ -27,7 +27,8 @@ from typing import Optional
 from backend.shared.config.database import get_db
 from backend.enterprise.security.rbac.auth import (
     get_current_user, require_permission, CurrentUser,
-    verify_password, create_token, hash_password
+    verify_password, create_token, hash_password, password_needs_rehash,
+    reject_unknown_user,
 )
 from backend.enterprise.security.audit.audit_trail import AuditTrail
 from backend.enterprise.saas.tenants.tenant_service import TenantService
@@ -134,7 +135,11 @@ def login(req: LoginRequest, request: Request, db: Session = Depends(get_db)):
     """Authenticate with email + password. Returns a JWT Bearer token."""
     user_row = tenant_svc.get_user_by_email(db, req.email)
 
-    if not user_row or not verify_password(req.password, user_row.get("password_hash", "")):
+    if user_row:
+        valid = verify_password(req.password, user_row.get("password_hash", ""))
+    else:
+        valid = reject_unknown_user(req.password)
+    if not valid:
         AuditTrail.log(
             db=db, action="auth.login.failed",
             new_value={"email": req.email},
@@ -143,6 +148,8 @@ def login(req: LoginRequest, request: Request, db: Session = Depends(get_db)):
         )
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
+    if password_needs_rehash(user_row["password_hash"]):
+        tenant_svc.update_password_hash(db, user_row["id"], req.password)
     tenant_svc.record_login(db, user_row["id"])
 
     token = create_token(
@@ -101,8 +101,7 @@ def create_user(
         raise HTTPException(status_code=400,
                             detail=f"Invalid role. Must be one of: {sorted(valid_roles)}")
 
-    existing_users = tenant_svc.list_users(db, tenant_id)
-    if any(u["email"].lower() == req.email.lower() for u in existing_users):
+    if tenant_svc.user_email_exists(db, tenant_id, req.email):
         raise HTTPException(status_code=409, detail="A user with this email already exists.")
 
     result = tenant_svc.create_user(
@@ -32,6 +32,7 @@ import uuid
 import datetime
 import secrets
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict
 from sqlalchemy.orm import Session
 from sqlalchemy import text
@@ -173,6 +174,49 @@ class TenantService:
         logger.info("User created", user_id=uid, email=email, role=role)
         return self.get_user(db, uid)
 
+    def create_users_bulk(
+        self,
+        db:        Session,
+        tenant_id: str,
+        users:     List[dict],
+    ) -> List[str]:
+        """
+        Create many users in one transaction (e.g. an onboarding import).
+
+        Each dict carries email, password and optionally full_name / role
+        (default "migration_operator"). Passwords are hashed on a thread
+        pool — bcrypt releases the GIL — and the rows go to the DB as one
+        executemany batch instead of one INSERT + COMMIT per user.
+
+        Returns the new user ids, in input order. Plan limits are not
+        checked here; callers use check_limit() first, as for create_user.
+        """
+        if not users:
+            return []
+        now = datetime.datetime.utcnow()
+        with ThreadPoolExecutor() as pool:
+            hashes = list(pool.map(hash_password, (u["password"] for u in users)))
+        params = [
+            {
+                "id": str(uuid.uuid4()), "tid": tenant_id, "email": u["email"],
+                "pwd": hpwd, "name": u.get("full_name"),
+                "role": u.get("role", "migration_operator"), "now": now,
+            }
+            for u, hpwd in zip(users, hashes)
+        ]
+        db.execute(
+            text("""
+                INSERT INTO users
+                    (id, tenant_id, email, password_hash, full_name, role, is_active, created_at, updated_at)
+                VALUES
+                    (:id, :tid, :email, :pwd, :name, :role, TRUE, :now, :now)
+            """),
+            params
+        )
+        db.commit()
+        logger.info("Users created", tenant_id=tenant_id, count=len(params))
+        return [p["id"] for p in params]
+
     def get_user(self, db: Session, user_id: str) -> Optional[dict]:
         row = db.execute(
             text("SELECT id, tenant_id, email, full_name, role, is_active, last_login_at, created_at FROM users WHERE id = :id"),
@@ -182,8 +226,12 @@ class TenantService:
 
     def get_user_by_email(self, db: Session, email: str) -> Optional[dict]:
         """Returns user WITH password_hash (for login verification only)."""
+        # Only the columns login reads — not every profile column on the row
         row = db.execute(
-            text("SELECT * FROM users WHERE email = :email AND is_active = TRUE"),
+            text("""
+                SELECT id, tenant_id, email, password_hash, full_name, role
+                FROM users WHERE email = :email AND is_active = TRUE
+            """),
             {"email": email}
         ).fetchone()
         return self._row(row) if row else None
@@ -198,6 +246,14 @@ class TenantService:
         ).fetchall()
         return [self._row(r) for r in rows]
 
+    def user_email_exists(self, db: Session, tenant_id: str, email: str) -> bool:
+        """Case-insensitive email check within a tenant (no user rows loaded)."""
+        row = db.execute(
+            text("SELECT 1 FROM users WHERE tenant_id = :tid AND LOWER(email) = LOWER(:email) LIMIT 1"),
+            {"tid": tenant_id, "email": email}
+        ).fetchone()
+        return row is not None
+
     def update_user_role(self, db: Session, user_id: str, new_role: str) -> dict:
         valid_roles = {"platform_admin","tenant_admin","migration_admin",
                        "migration_operator","read_only","auditor","api_client"}
@@ -210,6 +266,14 @@ class TenantService:
         db.commit()
         return self.get_user(db, user_id)
 
+    def update_password_hash(self, db: Session, user_id: str, password: str):
+        """Re-hash *password* with the current settings and store it."""
+        db.execute(
+            text("UPDATE users SET password_hash=:pwd, updated_at=:now WHERE id=:id"),
+            {"pwd": hash_password(password), "now": datetime.datetime.utcnow(), "id": user_id}
+        )
+        db.commit()
+
     def record_login(self, db: Session, user_id: str):
         db.execute(
             text("UPDATE users SET last_login_at=:now WHERE id=:id"),
@@ -34,6 +34,8 @@ import os
 import uuid
 import datetime
 import hashlib
+import threading
+import time
 from typing import Optional, List
 from functools import lru_cache
 
@@ -66,12 +68,22 @@ JWT_EXPIRE_HOURS = int(os.environ.get("JWT_EXPIRE_HOURS", "24"))
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# bcrypt work factor; each +1 doubles hashing (and login) CPU time.
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+
 
 # ── Password hashing ──────────────────────────────────────────────────────────
 
+# bcrypt only reads the first 72 bytes; bcrypt>=5 raises on longer input.
+# Slicing the encoded bytes keeps old hashes valid and never round-trips str.
+_BCRYPT_MAX_BYTES = 72
+
+
 def hash_password(password: str) -> str:
     if BCRYPT_AVAILABLE:
-        return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+        return bcrypt.hashpw(
+            password.encode()[:_BCRYPT_MAX_BYTES], bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+        ).decode()
     # Fallback: SHA-256 (not production-safe — install bcrypt)
     import hashlib
     return "sha256:" + hashlib.sha256(password.encode()).hexdigest()
@@ -82,10 +94,40 @@ def verify_password(plain: str, hashed: str) -> bool:
         import hashlib
         return hashed == "sha256:" + hashlib.sha256(plain.encode()).hexdigest()
     if BCRYPT_AVAILABLE:
-        return bcrypt.checkpw(plain.encode(), hashed.encode())
+        return bcrypt.checkpw(plain.encode()[:_BCRYPT_MAX_BYTES], hashed.encode())
     return False
 
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    return hash_password("not-a-real-password")
+
+
+def reject_unknown_user(plain: str) -> bool:
+    """
+    Login miss path: spend the same bcrypt work as a real check, then fail.
+    Keeps unknown and known emails indistinguishable by response time.
+    """
+    verify_password(plain, _dummy_password_hash())
+    return False
+
+
+def password_needs_rehash(hashed: str) -> bool:
+    """
+    True if *hashed* was not produced with the current settings — a SHA-256
+    fallback hash, or bcrypt with a cost other than BCRYPT_ROUNDS.
+    Call after a successful verify_password() to upgrade stored hashes.
+    """
+    if not BCRYPT_AVAILABLE:
+        return False
+    if hashed.startswith("sha256:"):
+        return True
+    try:
+        return int(hashed.split("$")[2]) != BCRYPT_ROUNDS   # $2b$<cost>$...
+    except (IndexError, ValueError):
+        return False
+
+
 # ── JWT tokens ────────────────────────────────────────────────────────────────
 
 def create_token(user_id: str, tenant_id: str, role: str, email: str) -> str:
@@ -110,6 +152,12 @@ def create_token(user_id: str, tenant_id: str, role: str, email: str) -> str:
     }).encode()).decode()
 
 
+# Clients reuse one bearer token for many requests: remember verified ones.
+_TOKEN_CACHE_MAX = 8192
+_token_cache: dict = {}         # token → (exp epoch seconds, payload)
+_token_cache_lock = threading.Lock()
+
+
 def decode_token(token: str) -> Optional[dict]:
     """Decode and verify a JWT token. Returns payload or None."""
     if token.startswith("dev:"):
@@ -120,12 +168,26 @@ def decode_token(token: str) -> Optional[dict]:
             return None
     if not JWT_AVAILABLE:
         return None
+    with _token_cache_lock:
+        hit = _token_cache.get(token)
+    if hit:
+        if hit[0] > time.time():
+            return hit[1]
+        with _token_cache_lock:
+            _token_cache.pop(token, None)
+        raise HTTPException(status_code=401, detail="Token expired")
     try:
-        return pyjwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = pyjwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
     except pyjwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except pyjwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
+    if isinstance(payload.get("exp"), (int, float)):
+        with _token_cache_lock:
+            if len(_token_cache) >= _TOKEN_CACHE_MAX:
+                del _token_cache[next(iter(_token_cache))]   # oldest entry
+            _token_cache[token] = (payload["exp"], payload)
+    return payload
 
 
 # ── Current user dependency ───────────────────────────────────────────────────
@@ -222,8 +284,25 @@ def optional_auth(
 
 # ── Role permissions lookup ───────────────────────────────────────────────────
 
+# Every authenticated request resolves its role; keep DB answers briefly.
+ROLE_CACHE_TTL_SECONDS = 60
+_role_cache: dict = {}          # role name → (expires_at, permissions)
+_role_cache_lock = threading.Lock()
+
+
+def clear_role_cache():
+    """Drop cached role permissions (call after editing the roles table)."""
+    with _role_cache_lock:
+        _role_cache.clear()
+
+
 def _get_permissions_for_role(db: Session, role_name: str) -> List[str]:
     """Load permissions for a role from the DB. Cached by role name."""
+    now = time.monotonic()
+    with _role_cache_lock:
+        hit = _role_cache.get(role_name)
+    if hit and hit[0] > now:
+        return hit[1]
     try:
         row = db.execute(
             text("SELECT permissions FROM roles WHERE name = :n"),
@@ -231,10 +310,12 @@ def _get_permissions_for_role(db: Session, role_name: str) -> List[str]:
         ).fetchone()
         if row and row[0]:
             perms = row[0]
-            if isinstance(perms, list):
-                return perms
-            import json
-            return json.loads(perms) if isinstance(perms, str) else ["*:read"]
+            if not isinstance(perms, list):
+                import json
+                perms = json.loads(perms) if isinstance(perms, str) else ["*:read"]
+            with _role_cache_lock:
+                _role_cache[role_name] = (now + ROLE_CACHE_TTL_SECONDS, perms)
+            return perms
     except Exception as e:
         logger.warning("Could not load role permissions", role=role_name, error=str(e))
     # Fallback defaults
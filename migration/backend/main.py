@@ -51,6 +51,7 @@ API sections available at port 8000:
     /scheduler, /reports, /knowledge         → Scheduler + Reporting + KB
 """
 
+import asyncio
 import sys
 import os
 
@@ -231,8 +232,11 @@ except Exception as e:
 
 # ── Startup ────────────────────────────────────────────────────────────────────
 
-@app.on_event("startup")
-def on_startup():
+app.state.ready = False
+
+
+def _initialize_platform():
+    """Registrations and background loops; slow on a cold database."""
     from backend.shared.config.logging import logger
     from backend.shared.config.database import SessionLocal
 
@@ -367,6 +371,19 @@ def on_startup():
         db.close()
 
 
+@app.on_event("startup")
+async def on_startup():
+    # Start serving straight away; /health reports "starting" until the
+    # registrations above have run on a worker thread.
+    def _mark_ready(task):
+        app.state.ready = not task.cancelled() and task.exception() is None
+        if not app.state.ready:
+            print(f"[WARN] Platform initialisation did not complete: {task!r}")
+
+    app.state.init_task = asyncio.create_task(asyncio.to_thread(_initialize_platform))
+    app.state.init_task.add_done_callback(_mark_ready)
+
+
 # ── Health ─────────────────────────────────────────────────────────────────────
 
 @app.get("/health", tags=["Health"])
@@ -394,8 +411,13 @@ def health():
     except Exception:
         pass
 
+    if not app.state.ready:
+        status = "starting"
+    else:
+        status = "ok" if redis_ok else "degraded"
+
     return {
-        "status":           "ok" if redis_ok else "degraded",
+        "status":           status,
         "service":          "migration_platform_kernel",
         "port":             8000,
         "version":          "1.0.0",
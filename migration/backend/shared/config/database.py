@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.exc import SQLAlchemyError
@@ -18,10 +19,13 @@ def get_database_url() -> str:
 
 engine = create_engine(
     get_database_url(),
-    pool_size=20,
-    max_overflow=50,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
     pool_pre_ping=True,
     pool_recycle=3600,
+    # TCP keepalives so idle pooled connections are not silently dropped by
+    # NAT/firewalls between bursts (pre_ping would then pay a reconnect)
+    connect_args={"keepalives": 1, "keepalives_idle": 30},
     echo=settings.debug
 )
 
@@ -42,6 +46,25 @@ def get_db():
     finally:
         db.close()
 
+@contextmanager
+def session_scope():
+    """
+    Session for code outside a request (threads, workers, callbacks):
+    commits on success, rolls back on error, always returns the connection.
+
+        with session_scope() as db:
+            db.execute(...)
+    """
+    db = SessionFactory()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
 def check_database_connection() -> bool:
     try:
         with engine.connect() as conn:
@@ -15,6 +15,8 @@ class Settings(BaseSettings):
     postgres_db: str
     postgres_user: str
     postgres_password: str
+    db_pool_size: int = 20       # connections kept open per process
+    db_max_overflow: int = 50    # extra connections allowed under burst
 
     # Redis
     redis_host: str
@@ -22,7 +22,7 @@ import datetime
 import uuid
 from sqlalchemy.orm import Session
 
-from backend.shared.config.database import SessionLocal
+from backend.shared.config.database import SessionLocal, session_scope
 from backend.shared.config.redis import redis_client
 from backend.shared.config.logging import logger
 from backend.shared.constants.queues import Queues
@@ -167,35 +167,32 @@ class Worker:
         while self.running:
             time.sleep(HEARTBEAT_INTERVAL)
             try:
-                db = SessionLocal()
                 from sqlalchemy import text
-                db.execute(
-                    text("""
-                        UPDATE worker_heartbeats
-                        SET last_heartbeat=:now, status=:status
-                        WHERE worker_id=:wid
-                    """),
-                    {
-                        "now":    datetime.datetime.utcnow(),
-                        "status": "BUSY" if self.busy else "IDLE",
-                        "wid":    self.worker_id,
-                    }
-                )
-                db.commit()
-                db.close()
+                # a failed heartbeat must not leak its pool slot
+                with session_scope() as db:
+                    db.execute(
+                        text("""
+                            UPDATE worker_heartbeats
+                            SET last_heartbeat=:now, status=:status
+                            WHERE worker_id=:wid
+                        """),
+                        {
+                            "now":    datetime.datetime.utcnow(),
+                            "status": "BUSY" if self.busy else "IDLE",
+                            "wid":    self.worker_id,
+                        }
+                    )
             except Exception as e:
                 logger.warning("Heartbeat failed", error=str(e))
 
     def _update_status(self, status: str):
         try:
-            db = SessionLocal()
             from sqlalchemy import text
-            db.execute(
-                text("UPDATE worker_heartbeats SET status=:s, last_heartbeat=:now WHERE worker_id=:wid"),
-                {"s": status, "now": datetime.datetime.utcnow(), "wid": self.worker_id}
-            )
-            db.commit()
-            db.close()
+            with session_scope() as db:
+                db.execute(
+                    text("UPDATE worker_heartbeats SET status=:s, last_heartbeat=:now WHERE worker_id=:wid"),
+                    {"s": status, "now": datetime.datetime.utcnow(), "wid": self.worker_id}
+                )
         except Exception:
             pass
 
@@ -0,0 +1,45 @@
+-- ============================================================================
+-- Migration Platform Kernel — Indexes for the /metrics summary
+-- File: migration/db_migrations/018_metrics_indexes.sql
+--
+-- GET /metrics (monitoring_service/app/routers/metrics.py) reads every
+-- figure through MonitoringRepository.get_platform_summary(): job counts by
+-- status, worker counts, and SUM(rows_processed) over completed chunks.
+-- Without these indexes the chunk sum is a sequential scan of
+-- migration_chunks, which grows by thousands of rows per job.
+--
+-- Partial/covering indexes were chosen over a materialized summary table so
+-- the endpoint keeps returning live numbers (no refresh job, no staleness).
+-- worker_heartbeats gets no index: the summary also counts every worker
+-- row, so that table is scanned in full regardless.
+--
+-- CONCURRENTLY avoids blocking chunk and job writes while the indexes build
+-- on a live system; it cannot run inside a transaction block.
+--
+-- Run:
+--   psql -U postgres -d migration_metadata -f 018_metrics_indexes.sql
+-- ============================================================================
+
+
+-- ── migration_chunks ──────────────────────────────────────────────────────
+-- Index-only SUM(rows_processed) over completed chunks.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_completed_rows
+    ON migration_chunks (status) INCLUDE (rows_processed)
+    WHERE status = 'completed';
+
+
+-- ── migration_jobs ────────────────────────────────────────────────────────
+-- Counts by status without touching the wide JSONB config rows.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_status ON migration_jobs (status);
+
+
+-- ── Verification ───────────────────────────────────────────────────────────
+
+\echo '--- Verification: metrics indexes ---'
+SELECT indexname FROM pg_indexes
+WHERE schemaname = 'public' AND indexname IN (
+    'idx_chunks_completed_rows', 'idx_jobs_status'
+)
+ORDER BY indexname;
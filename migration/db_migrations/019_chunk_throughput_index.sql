@@ -0,0 +1,34 @@
+-- ============================================================================
+-- Migration Platform Kernel — Index for per-job chunk throughput
+-- File: migration/db_migrations/019_chunk_throughput_index.sql
+--
+-- GET /jobs/{job_id}/metrics computes rows/sec from the job's 10 most
+-- recently completed chunks (MonitoringRepository.get_throughput_rps):
+--
+--   SELECT rows_processed, duration_ms FROM migration_chunks
+--   WHERE job_id = :job AND status = 'completed'
+--     AND rows_processed > 0 AND duration_ms > 0
+--   ORDER BY completed_at DESC LIMIT 10
+--
+-- The partial index below matches that filter, is ordered for the LIMIT,
+-- and covers both selected columns, so the query is an index-only scan of
+-- ten entries instead of a sort over every completed chunk of the job.
+--
+-- CONCURRENTLY avoids blocking chunk writes while the index builds on a
+-- live system; it cannot run inside a transaction block.
+--
+-- Run:
+--   psql -U postgres -d migration_metadata -f 019_chunk_throughput_index.sql
+-- ============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_throughput
+    ON migration_chunks (job_id, completed_at DESC)
+    INCLUDE (rows_processed, duration_ms)
+    WHERE status = 'completed' AND rows_processed > 0 AND duration_ms > 0;
+
+
+-- ── Verification ───────────────────────────────────────────────────────────
+
+\echo '--- Verification: throughput index ---'
+SELECT indexname FROM pg_indexes
+WHERE schemaname = 'public' AND indexname = 'idx_chunks_throughput';